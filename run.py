@@ -1,49 +1,67 @@
 import sys
 import pygame
-from spacegame.screens.main_menu import main as main_menu
-from spacegame.screens.game_screen import run_game
-from spacegame.screens.end_screen import end_screen
 
 STATE_MAIN_MENU = "main_menu"
 STATE_GAME      = "game"
 STATE_END       = "end"
 STATE_EXIT      = "exit"
 
+# Screen modules are imported inside their handlers so startup only pays
+# for the screens that are actually visited.
+
+def _main_menu_state():
+    # main menu: choose play or exit
+    from spacegame.screens.main_menu import main as main_menu
+    result = main_menu()
+    if result in (STATE_GAME, STATE_EXIT):
+        return result
+    # default fallback: if None, go to EXIT
+    return STATE_EXIT
+
+
+def _game_state():
+    # main gameplay
+    from spacegame.screens.game_screen import run_game
+    from spacegame.screens.galactic_map_screen import clear_galactic_map_cache
+    result = run_game()
+    # release the galactic map's large surfaces; run_game reloads them
+    clear_galactic_map_cache()
+    if result in (STATE_MAIN_MENU, STATE_END, STATE_EXIT):
+        return result
+    # ESC fallback: go back to main menu
+    return STATE_MAIN_MENU
+
+
+def _end_state():
+    # game over screen
+    from spacegame.screens.end_screen import end_screen
+    result = end_screen()
+    if result in (STATE_GAME, STATE_MAIN_MENU, STATE_EXIT):
+        return result
+    # default: go back to main menu
+    return STATE_MAIN_MENU
+
+
+STATE_HANDLERS = {
+    STATE_MAIN_MENU: _main_menu_state,
+    STATE_GAME: _game_state,
+    STATE_END: _end_state,
+}
+
+
+def _exit_state():
+    # unknown state -> exit
+    return STATE_EXIT
+
+
 def run_state_machine():
-    pygame.init()
+    # the mixer is left to SoundManager, which opens it on the first sound
+    pygame.display.init()
+    pygame.font.init()
     state = STATE_MAIN_MENU
 
     while state != STATE_EXIT:
-        if state == STATE_MAIN_MENU:
-            # main menu: choose play or exit
-            result = main_menu()
-            if result in (STATE_GAME, STATE_EXIT):
-                state = result
-            else:
-                # default fallback: if None, go to EXIT
-                state = STATE_EXIT
-
-        elif state == STATE_GAME:
-            # main gameplay
-            result = run_game()
-            if result in (STATE_MAIN_MENU, STATE_END, STATE_EXIT):
-                state = result
-            else:
-                # ESC fallback: go back to main menu
-                state = STATE_MAIN_MENU
-
-        elif state == STATE_END:
-            # game over screen
-            result = end_screen()
-            if result in (STATE_GAME, STATE_MAIN_MENU, STATE_EXIT):
-                state = result
-            else:
-                # default: go back to main menu
-                state = STATE_MAIN_MENU
-
-        else:
-            # unknown state → exit
-            state = STATE_EXIT
+        state = STATE_HANDLERS.get(state, _exit_state)()
 
     pygame.quit()
     sys.exit()
@@ -1,46 +1,145 @@
+import math
 import pygame
 import random
-from pygame.math import Vector2
 
-# Central effects group used by the game loop for updates/draws
-effects_group = pygame.sprite.Group()
+# Number of quantized alpha levels particles fade through
+ALPHA_STEPS = 16
 
+# Soft cap on live particles; the oldest are dropped first when exceeded
+MAX_PARTICLES = 1500
 
-class Particle(pygame.sprite.Sprite):
-    """Simple particle: circle that moves, fades, and dies."""
+# Pre-baked particle images: (color, radius) -> (one surface per alpha level, half size)
+_particle_cache = {}
 
-    def __init__(self, pos, vel, color, radius=1, lifetime=0.6):
-        super().__init__()
-        self.pos = Vector2(pos)
-        self.vel = Vector2(vel)
-        self.color = tuple(color)
-        self.radius = int(radius)
-        self.lifetime = float(lifetime)
-        self.max_life = float(lifetime)
 
-        size = max(2, self.radius * 2 + 2)
-        self.image = pygame.Surface((size, size), pygame.SRCALPHA)
-        pygame.draw.circle(self.image, self.color, (size // 2, size // 2), self.radius)
-        self.rect = self.image.get_rect(center=(int(self.pos.x), int(self.pos.y)))
+def _get_particle_images(color, radius):
+    """Return the faded circle surfaces for (color, radius), building them on first use.
+
+    Each alpha level is drawn into its own immutable surface so fading is a
+    plain blit of a different image rather than a per-frame `set_alpha`.
+    """
+    key = (color, radius)
+    entry = _particle_cache.get(key)
+    if entry is None:
+        size = max(2, radius * 2 + 2)
+        convert = pygame.display.get_surface() is not None
+        levels = []
+        for i in range(ALPHA_STEPS):
+            alpha = (i + 1) * (256 // ALPHA_STEPS) - 1
+            surf = pygame.Surface((size, size), pygame.SRCALPHA)
+            pygame.draw.circle(surf, (*color[:3], alpha), (size // 2, size // 2), radius)
+            levels.append(surf.convert_alpha() if convert else surf)
+        entry = (levels, size // 2)
+        _particle_cache[key] = entry
+    return entry
+
+
+class ParticleSystem:
+    """Particle pool stored as parallel lists (structure of arrays).
+
+    Replaces per-particle sprites: one `update` pass advances every particle
+    and `draw` issues a single `Surface.blits` call instead of one
+    Python-level update and blit per particle. Exposes the
+    `update`/`draw`/`empty`/`len` subset of `pygame.sprite.Group` the game
+    loop relies on.
+
+    At most `max_particles` are kept alive: adding past the cap evicts the
+    oldest particles first so heavy combat cannot grow the pool unbounded.
+    """
+
+    def __init__(self, max_particles=MAX_PARTICLES):
+        self.max_particles = max_particles
+        self.pos_x = []
+        self.pos_y = []
+        self.vel_x = []
+        self.vel_y = []
+        self.life = []
+        self.max_life = []
+        self.images = []
+
+    def __len__(self):
+        return len(self.life)
+
+    def add(self, pos, vel, color, radius=1, lifetime=0.6):
+        """Append one particle: a circle that moves, fades, and dies."""
+        if lifetime <= 0:
+            return
+        self.pos_x.append(float(pos[0]))
+        self.pos_y.append(float(pos[1]))
+        self.vel_x.append(float(vel[0]))
+        self.vel_y.append(float(vel[1]))
+        self.life.append(float(lifetime))
+        self.max_life.append(float(lifetime))
+        self.images.append(_get_particle_images(tuple(color), int(radius)))
+        self._evict_overflow()
+
+    def add_burst(self, pos, vel_x, vel_y, color, radius=1, lifetime=0.6):
+        """Append one particle per (vel_x[i], vel_y[i]) pair, all sharing `pos`, color and lifetime."""
+        count = len(vel_x)
+        if lifetime <= 0 or count == 0:
+            return
+        self.pos_x.extend([float(pos[0])] * count)
+        self.pos_y.extend([float(pos[1])] * count)
+        self.vel_x.extend(vel_x)
+        self.vel_y.extend(vel_y)
+        self.life.extend([float(lifetime)] * count)
+        self.max_life.extend([float(lifetime)] * count)
+        self.images.extend([_get_particle_images(tuple(color), int(radius))] * count)
+        self._evict_overflow()
+
+    def _evict_overflow(self):
+        # buffers stay in spawn order (update compacts in place), so the
+        # oldest particles are at the front
+        overflow = len(self.life) - self.max_particles
+        if overflow > 0:
+            for buf in (self.pos_x, self.pos_y, self.vel_x, self.vel_y, self.life, self.max_life, self.images):
+                del buf[:overflow]
+
+    def empty(self):
+        for buf in (self.pos_x, self.pos_y, self.vel_x, self.vel_y, self.life, self.max_life, self.images):
+            buf.clear()
 
     def update(self, dt: float = 0.016):
-        self.pos += self.vel * dt
-        self.rect.center = (int(self.pos.x), int(self.pos.y))
-        self.lifetime -= dt
+        """Advance all particles by `dt` and compact out the expired ones in place."""
         # simple damping so particles slow and don't travel too far
-        try:
-            self.vel *= max(0.0, 1.0 - 3.0 * dt)
-        except Exception:
-            pass
-        # fade out
-        if self.max_life > 0:
-            alpha = int(255 * max(0.0, min(1.0, self.lifetime / self.max_life)))
-            try:
-                self.image.set_alpha(alpha)
-            except Exception:
-                pass
-        if self.lifetime <= 0:
-            self.kill()
+        damp = max(0.0, 1.0 - 3.0 * dt)
+        pos_x, pos_y = self.pos_x, self.pos_y
+        vel_x, vel_y = self.vel_x, self.vel_y
+        life, max_life, images = self.life, self.max_life, self.images
+        w = 0
+        for i in range(len(life)):
+            remaining = life[i] - dt
+            if remaining <= 0:
+                continue
+            vx = vel_x[i]
+            vy = vel_y[i]
+            pos_x[w] = pos_x[i] + vx * dt
+            pos_y[w] = pos_y[i] + vy * dt
+            vel_x[w] = vx * damp
+            vel_y[w] = vy * damp
+            life[w] = remaining
+            max_life[w] = max_life[i]
+            images[w] = images[i]
+            w += 1
+        for buf in (pos_x, pos_y, vel_x, vel_y, life, max_life, images):
+            del buf[w:]
+
+    def draw(self, surface):
+        """Blit all particles in one batched call."""
+        top = ALPHA_STEPS - 1
+        # fade out; life never exceeds max_life so the level stays in range
+        surface.blits(
+            [
+                (levels[int(top * life / max_life)], (int(x) - half, int(y) - half))
+                for x, y, life, max_life, (levels, half)
+                in zip(self.pos_x, self.pos_y, self.life, self.max_life, self.images)
+            ],
+            doreturn=False,
+        )
+
+
+# Central particle system used by the game loop for updates/draws
+effects_group = ParticleSystem()
 
 
 def spawn_explosion(pos, *, color=(255, 180, 80), count=16, speed=120.0, spread=360, radius=1, lifetime=0.8, scale=1.0):
@@ -59,17 +158,21 @@ def spawn_explosion(pos, *, color=(255, 180, 80), count=16, speed=120.0, spread=
     s = float(speed) * float(scale)
     r = max(1, int(radius * scale))
     life = float(lifetime) * max(0.25, scale)
-    for i in range(count):
-        angle = random.random() * (spread / 180.0) * 3.14159265
+    uniform = random.uniform
+    hypot = math.hypot
+    vel_x = []
+    vel_y = []
+    for _ in range(count):
         # random direction
-        dx = random.uniform(-1.0, 1.0)
-        dy = random.uniform(-1.0, 1.0)
-        vel = Vector2(dx, dy)
-        if vel.length_squared() == 0:
-            vel = Vector2(1, 0)
-        vel = vel.normalize() * (s * random.uniform(0.1, 0.5))
-        p = Particle(pos, vel, color, radius=r, lifetime=life)
-        effects_group.add(p)
+        dx = uniform(-1.0, 1.0)
+        dy = uniform(-1.0, 1.0)
+        norm = hypot(dx, dy)
+        if norm == 0:
+            dx, dy, norm = 1.0, 0.0, 1.0
+        mag = s * uniform(0.1, 0.5) / norm
+        vel_x.append(dx * mag)
+        vel_y.append(dy * mag)
+    effects_group.add_burst(pos, vel_x, vel_y, color, radius=r, lifetime=life)
 
 
 def spawn_dust(pos, *, color=(180, 160, 120), count=20, speed=64.0, radius=3, lifetime=0.8, scale=1.0):
@@ -80,19 +183,22 @@ def spawn_dust(pos, *, color=(180, 160, 120), count=20, speed=64.0, radius=3, li
     s = float(speed) * float(scale)
     r = max(1, int(radius * scale))
     life = float(lifetime) * max(0.1, scale)
-    for i in range(count):
-        dx = random.uniform(-1.0, 1.0)
-        dy = random.uniform(-1.0, 1.0)
-        vel = Vector2(dx, dy)
-        if vel.length_squared() == 0:
-            vel = Vector2(0.1, -0.1)
-        vel = vel.normalize() * (s * random.uniform(0.175, 0.75))
+    uniform = random.uniform
+    hypot = math.hypot
+    lift = s * 0.02
+    vel_x = []
+    vel_y = []
+    for _ in range(count):
+        dx = uniform(-1.0, 1.0)
+        dy = uniform(-1.0, 1.0)
+        norm = hypot(dx, dy)
+        if norm == 0:
+            dx, dy, norm = 0.1, -0.1, hypot(0.1, 0.1)
+        mag = s * uniform(0.175, 0.75) / norm
+        vel_x.append(dx * mag)
         # slight upward bias
-        vel.y -= abs(random.uniform(0.0, 0.2) * s * 0.02)
-        p = Particle(pos, vel, color, radius=r, lifetime=life)
-        effects_group.add(p)
-
-
+        vel_y.append(dy * mag - abs(uniform(0.0, 0.2) * lift))
+    effects_group.add_burst(pos, vel_x, vel_y, color, radius=r, lifetime=life)
 
 
 # Convenience alias used by other modules
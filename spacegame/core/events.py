@@ -1,8 +1,9 @@
 import pygame
 
 # Custom event types for the game. Uses pygame.USEREVENT range.
-# Consumers should call `make_save_game_event(owner)` to create an event
-# that requests saving the provided owner object.
+# Consumers should call `post_save_game_event(owner)` (or post the result of
+# `make_save_game_event(owner)` themselves) to request saving the provided
+# owner object.
 
 SAVE_GAME_EVENT = pygame.USEREVENT + 1
 
@@ -13,4 +14,9 @@ def make_save_game_event(owner):
     The event will carry an `owner` attribute referencing the object
     that should be persisted (typically the `ExpeditionShip`).
     """
-    return pygame.event.Event(SAVE_GAME_EVENT, {"owner": owner})
+    return pygame.event.Event(SAVE_GAME_EVENT, owner=owner)
+
+
+def post_save_game_event(owner):
+    """Post a SAVE_GAME event for `owner` straight onto the pygame queue."""
+    pygame.event.post(pygame.event.Event(SAVE_GAME_EVENT, owner=owner))
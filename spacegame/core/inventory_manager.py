@@ -36,12 +36,10 @@ class InventoryManager:
         """
         # Avoid module-level cycles by importing here.
         try:
-            import pygame
             from spacegame.core import events as _events
 
-            ev = _events.make_save_game_event(self.owner)
             try:
-                pygame.event.post(ev)
+                _events.post_save_game_event(self.owner)
             except Exception:
                 # If posting to the event queue fails (unlikely), fall back
                 # to performing a direct save below.
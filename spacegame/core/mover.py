@@ -1,4 +1,3 @@
-import pygame
 import math
 from pygame.math import Vector2
 from spacegame import config
@@ -19,6 +18,12 @@ class Mover:
     def set_target(self, position):
         self.target_pos = Vector2(position)
 
+    def stop(self):
+        """Hold at the current position without allocating a new target vector."""
+        # same state update() leaves behind on arrival: the target is the
+        # position itself, so the distance check keeps the ship still
+        self.target_pos = self.world_pos
+
     def update(self, dt):
         """Move and rotate smoothly toward the target."""
         direction = self.target_pos - self.world_pos
@@ -42,10 +47,13 @@ class Mover:
 
     def point_inside(self, point):
         """Axis-aligned bounding box check around self.pos (centered)."""
-        w, h = self.ship_size
-        rect = pygame.Rect(0, 0, w, h)
-        rect.center = (int(self.world_pos.x), int(self.world_pos.y))
-        return rect.collidepoint(point)
+        # same bounds as a Rect of ship_size centered on world_pos, compared
+        # directly instead of building a Rect per test
+        w, h = int(self.ship_size[0]), int(self.ship_size[1])
+        left = int(self.world_pos.x) - w // 2
+        top = int(self.world_pos.y) - h // 2
+        px, py = point
+        return left <= px < left + w and top <= py < top + h
 
     # ---------------- Collision ----------------
     @staticmethod
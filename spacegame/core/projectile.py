@@ -9,6 +9,54 @@ from spacegame.config import (
 )
 from spacegame.core.effects import add_explosion
 
+# Rendered projectile sprites keyed by (radius, color); projectiles never
+# modify their image, so all shots of one kind share a single surface.
+_circle_image_cache = {}
+
+
+def _get_circle_image(radius, color):
+    image = _circle_image_cache.get((radius, color))
+    if image is None:
+        size = radius * 2 + 2
+        image = pygame.Surface((size, size), pygame.SRCALPHA)
+        pygame.draw.circle(image, color, (size // 2, size // 2), radius)
+        # match the display pixel format so group.draw() blits skip conversion
+        if pygame.display.get_surface() is not None:
+            image = image.convert_alpha()
+        _circle_image_cache[(radius, color)] = image
+    return image
+
+
+# One collision mask per projectile radius, shared by every projectile of
+# that size (the mask depends only on the filled circle, not the colour).
+_circle_mask_cache = {}
+
+
+def _get_circle_mask(radius):
+    mask = _circle_mask_cache.get(radius)
+    if mask is None:
+        size = radius * 2 + 2
+        surf = pygame.Surface((size, size), pygame.SRCALPHA)
+        pygame.draw.circle(surf, (255, 255, 255), (size // 2, size // 2), radius)
+        mask = pygame.mask.from_surface(surf)
+        _circle_mask_cache[radius] = mask
+    return mask
+
+
+def _step(proj, dt):
+    """Move `proj` by velocity*dt and decrement its lifetime.
+
+    Returns True once the projectile's lifetime has run out.
+    """
+    pos = proj.pos
+    x = pos.x + proj.vel_x * dt
+    y = pos.y + proj.vel_y * dt
+    pos.x = x
+    pos.y = y
+    proj.rect.center = (int(x), int(y))
+    proj.lifetime -= dt
+    return proj.lifetime <= 0
+
 
 class Projectile(pygame.sprite.Sprite):
     """Projectile sprite. Use in a `pygame.sprite.Group` for bulk update/draw.
@@ -31,6 +79,9 @@ class Projectile(pygame.sprite.Sprite):
         else:
             self.direction = self.direction.normalize()
         self.speed = float(self.SPEED if speed is None else speed)
+        # per-frame displacement components as plain floats (avoids Vector2 temporaries)
+        self.vel_x = self.direction.x * self.speed
+        self.vel_y = self.direction.y * self.speed
         self.radius = int(self.RADIUS if radius is None else radius)
 
         if hull_damage is None:
@@ -45,70 +96,71 @@ class Projectile(pygame.sprite.Sprite):
         self.lifetime = float(lifetime)
         self.owner_is_enemy = owner_is_enemy
 
-        # Create image, rect and mask for sprite rendering & collisions
-        size = self.radius * 2 + 2
-        self.image = pygame.Surface((size, size), pygame.SRCALPHA)
-        pygame.draw.circle(self.image, self.color, (size // 2, size // 2), self.radius)
+        # Shared image and mask for sprite rendering & collisions
+        self.image = _get_circle_image(self.radius, tuple(self.color))
         self.rect = self.image.get_rect(center=(int(self.pos.x), int(self.pos.y)))
-        try:
-            self.mask = pygame.mask.from_surface(self.image)
-        except Exception:
-            self.mask = None
+        self.mask = _get_circle_mask(self.radius)
 
     def update(self, dt: float = 0.016):
         # Move by velocity*dt and decrement lifetime; kill when expired
-        self.pos += self.direction * self.speed * dt
-        self.rect.center = (int(self.pos.x), int(self.pos.y))
-        self.lifetime -= dt
-        if self.lifetime <= 0:
-            try:
-                # small expiry puff (small particles)
-                add_explosion(self.pos, color=self.color, count=6, speed=self.speed * 0.25, radius=1, lifetime=0.25, scale=0.5)
-            except Exception:
-                pass
-            self.kill()
+        if _step(self, dt):
+            self.expire()
+
+    def expire(self):
+        """Spawn the small lifetime-expiry puff and remove the projectile."""
+        self.spawn_expiry_puff()
+        self.kill()
+
+    def spawn_expiry_puff(self):
+        """Spawn the lifetime-expiry puff without removing the projectile from its groups."""
+        # small expiry puff (small particles)
+        add_explosion(self.pos, color=self.color, count=6, speed=self.speed * 0.25, radius=1, lifetime=0.25, scale=0.5)
 
     def explode(self):
         """Spawn an impact explosion effect at the projectile position and remove the projectile."""
-        try:
-            # impact explosion: small particles regardless of projectile radius
-            add_explosion(self.pos, color=self.color, count=18, speed=self.speed * 0.45, radius=max(1, int(self.radius * 0.25)), lifetime=0.45, scale=0.9)
-        except Exception:
-            pass
-        try:
-            self.kill()
-        except Exception:
-            pass
+        self.spawn_impact()
+        self.kill()
+
+    def spawn_impact(self):
+        """Spawn the impact explosion without removing the projectile from its groups.
+
+        Lets callers resolving many hits remove the projectiles in one batch.
+        """
+        # impact explosion: small particles regardless of projectile radius
+        add_explosion(self.pos, color=self.color, count=18, speed=self.speed * 0.45, radius=max(1, int(self.radius * 0.25)), lifetime=0.45, scale=0.9)
 
     def collides_with_shape(self, spaceship):
         # Circle vs sprite mask collision detection with an arbitrary SpaceUnit
         surf, mask = spaceship.get_rotated_sprite()
         rect = spaceship.get_sprite_rect(surf)
 
-        projectile_rect = pygame.Rect(
-            int(self.pos.x - self.radius),
-            int(self.pos.y - self.radius),
-            self.radius * 2,
-            self.radius * 2,
-        )
-
+        # cheap AABB reject before the pixel test
+        projectile_rect = self.rect
         if not projectile_rect.colliderect(rect):
             return False
 
-        import math
-        test_points = [(int(self.pos.x), int(self.pos.y))]
-        steps = 16
-        for i in range(steps):
-            angle = 2 * math.pi * i / steps
-            px = int(self.pos.x + self.radius * math.cos(angle))
-            py = int(self.pos.y + self.radius * math.sin(angle))
-            test_points.append((px, py))
-
-        for px, py in test_points:
-            local_x = px - rect.left
-            local_y = py - rect.top
-            if (0 <= local_x < mask.get_size()[0] and 0 <= local_y < mask.get_size()[1]):
-                if mask.get_at((local_x, local_y)):
-                    return True
-
-        return False
\ No newline at end of file
+        # single C-side bitwise overlap of the shared circle mask against the ship mask
+        offset = (projectile_rect.left - rect.left, projectile_rect.top - rect.top)
+        return mask.overlap(self.mask, offset) is not None
+
+
+class ProjectileGroup(pygame.sprite.Group):
+    """`pygame.sprite.Group` that steps all of its projectiles in one loop.
+
+    Equivalent to calling `Projectile.update(dt)` on every member, but it
+    steps each projectile with `_step` directly instead of dispatching
+    through the sprite's update method.
+    """
+
+    def update(self, dt: float = 0.016):
+        expired = []
+        step = _step
+        for proj in self.sprites():
+            if step(proj, dt):
+                expired.append(proj)
+        if expired:
+            for proj in expired:
+                proj.spawn_expiry_puff()
+            # projectiles only ever live in this group, so one batched remove
+            # replaces a kill() per projectile
+            self.remove(*expired)
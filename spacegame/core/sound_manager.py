@@ -1,7 +1,8 @@
 """Sound Manager for Space Game.
 
 Manages all game audio using pygame mixer functions.
-Ensures only one sound plays at a time (mutual exclusivity).
+Sounds play on a small pool of mixer channels so overlapping cues are not
+dropped; unit-destroyed alerts preempt whatever chatter is playing.
 Maps game events to appropriate sound effects.
 """
 
@@ -9,7 +10,40 @@ import pygame
 import random
 import os
 from pathlib import Path
-from typing import Optional, Dict, List
+from enum import IntEnum
+from typing import Optional, Dict, List, Tuple
+
+# Mixer settings used when the sound manager opens the audio device. A
+# 512-sample buffer keeps command chatter responsive without the CPU churn
+# of very small buffers.
+MIXER_FREQUENCY = 44100
+MIXER_SIZE = -16
+MIXER_CHANNELS = 2
+MIXER_BUFFER = 512
+# Size of the playback channel pool
+MIXER_NUM_CHANNELS = 8
+
+# File extensions picked up from the sounds directory
+_SOUND_EXTS = frozenset({'ogg', 'wav', 'mp3'})
+
+
+class SndEvt(IntEnum):
+    """Sound event ids; each value indexes `SoundManager._groups_by_id`."""
+
+    MOVE_COMMAND = 0
+    DOCK_COMMAND = 1
+    HARVEST_COMMAND = 2
+    REPAIR_COMMAND = 3
+    HYPERSPACE_LAUNCH = 4
+    HYPERSPACE_COMPLETE = 5
+    REFINING_COMPLETE = 6
+    FABRICATION_COMPLETE = 7
+    SHIP_DOCKING = 8
+    RESOURCE_COLLECTOR_FULL = 9
+    RESOURCE_TRANSFER = 10
+    UNIT_DESTROYED_FRIGATE = 11
+    UNIT_DESTROYED_COLLECTOR = 12
+    UNIT_DESTROYED_STRIKEGROUP = 13
 
 
 class SoundManager:
@@ -21,10 +55,6 @@ class SoundManager:
         Args:
             sounds_dir: Path to the sounds directory. If None, uses default asset path.
         """
-        # Initialize pygame mixer if not already initialized
-        if not pygame.mixer.get_init():
-            pygame.mixer.init()
-
         # Set up sounds directory
         if sounds_dir is None:
             # Default path relative to this file
@@ -32,11 +62,19 @@ class SoundManager:
             sounds_dir = str(base_dir / "assets" / "sounds")
 
         self.sounds_dir = sounds_dir
+        # name -> file path for every sound found; decoded on first use
+        self._sound_paths: Dict[str, str] = {}
         self.sound_cache: Dict[str, pygame.mixer.Sound] = {}
-        self.current_sound_channel = pygame.mixer.Channel(0)
+        # Created by `_ensure_mixer` the first time audio is actually needed
+        self._channels: List[pygame.mixer.Channel] = []
+        # Set once opening the audio device fails so it is not retried
+        self._mixer_failed = False
+        # channel the most recent sound was started on
+        self.current_sound_channel: Optional[pygame.mixer.Channel] = None
+        self._volume = 1.0
         self.is_playing = False
 
-        # Load all sounds on initialization
+        # Index sound files on initialization (decoding is deferred)
         self._load_all_sounds()
 
         # Sound event groups for logical mapping
@@ -110,40 +148,112 @@ class SoundManager:
             "UNIT_DESTROYED_STRIKEGROUP": ["STATUS_REPORT_DESTROYED_STRIKEGROUP_1"]
         }
 
+        # Per-group names that have a sound file, resolved once instead of per play
+        self._available_by_group: Dict[str, Tuple[str, ...]] = {}
+        # Same tuples indexed by `SndEvt`, used by the on_* event triggers
+        self._groups_by_id: List[Tuple[str, ...]] = []
+        self._index_groups()
+
     def _load_all_sounds(self) -> None:
-        """Load all sound files from the sounds directory."""
+        """Index all sound files in the sounds directory.
+
+        Only the paths are recorded here; each file is decoded by
+        `_get_sound` the first time it is played (or by `preload`).
+        """
         if not os.path.isdir(self.sounds_dir):
             print(f"Warning: Sounds directory not found at {self.sounds_dir}")
             return
 
-        for filename in os.listdir(self.sounds_dir):
-            if filename.endswith(('.ogg', '.wav', '.mp3')):
-                sound_name = filename.rsplit('.', 1)[0]
-                sound_path = os.path.join(self.sounds_dir, filename)
-                try:
-                    sound = pygame.mixer.Sound(sound_path)
-                    self.sound_cache[sound_name] = sound
-                except pygame.error as e:
-                    print(f"Error loading sound {sound_name}: {e}")
+        # scandir hands back each entry's full path, saving a join per file
+        with os.scandir(self.sounds_dir) as entries:
+            for entry in entries:
+                sound_name, _, ext = entry.name.rpartition('.')
+                if sound_name and ext in _SOUND_EXTS:
+                    self._sound_paths[sound_name] = entry.path
+
+    def _index_groups(self) -> None:
+        """Rebuild `_available_by_group`/`_groups_by_id` from the current sound file index."""
+        paths = self._sound_paths
+        self._available_by_group = {
+            group_name: tuple(name for name in sound_names if name in paths)
+            for group_name, sound_names in self.sound_groups.items()
+        }
+        self._groups_by_id = [self._available_by_group.get(evt.name, ()) for evt in SndEvt]
 
-    def _is_sound_playing(self) -> bool:
-        """Check if any sound is currently playing."""
-        return pygame.mixer.get_busy()
+    def _ensure_mixer(self) -> bool:
+        """Initialize the mixer and playback channel pool on first use.
 
-    def _play_sound(self, sound: pygame.mixer.Sound) -> bool:
-        """Play a sound using the current channel.
+        Returns False if no audio device could be opened.
+        """
+        if self._channels:
+            return True
+        if self._mixer_failed:
+            return False
+        if not pygame.mixer.get_init():
+            try:
+                pygame.mixer.init(
+                    frequency=MIXER_FREQUENCY,
+                    size=MIXER_SIZE,
+                    channels=MIXER_CHANNELS,
+                    buffer=MIXER_BUFFER,
+                )
+            except pygame.error as e:
+                print(f"Error initializing audio: {e}")
+                self._mixer_failed = True
+                return False
+        pygame.mixer.set_num_channels(MIXER_NUM_CHANNELS)
+        self._channels = [pygame.mixer.Channel(i) for i in range(MIXER_NUM_CHANNELS)]
+        for channel in self._channels:
+            channel.set_volume(self._volume)
+        return True
+
+    def _get_sound(self, sound_name: str) -> Optional[pygame.mixer.Sound]:
+        """Return the decoded sound for `sound_name`, loading and caching it on first use.
+
+        Returns None if the sound is unknown or fails to decode; a failed
+        file is dropped from the index so it is not retried.
+        """
+        sound = self.sound_cache.get(sound_name)
+        if sound is None:
+            sound_path = self._sound_paths.get(sound_name)
+            if sound_path is None or not self._ensure_mixer():
+                return None
+            try:
+                sound = pygame.mixer.Sound(sound_path)
+            except pygame.error as e:
+                print(f"Error loading sound {sound_name}: {e}")
+                del self._sound_paths[sound_name]
+                self._index_groups()
+                return None
+            self.sound_cache[sound_name] = sound
+        return sound
+
+    def preload(self, group_name: str) -> None:
+        """Decode every sound in `group_name` now (e.g. during a loading screen)."""
+        for sound_name in self.sound_groups.get(group_name, ()):
+            self._get_sound(sound_name)
+
+    def _play_sound(self, sound: pygame.mixer.Sound, preempt: bool = False) -> bool:
+        """Play a sound on a free channel from the pool.
+
+        When every channel is busy the longest-running sound is replaced.
 
         Args:
             sound: The pygame Sound object to play.
+            preempt: Stop all other sounds first (used for high-priority alerts).
 
         Returns:
-            True if sound was played, False if a sound was already playing.
+            True if sound was played, False if audio is unavailable.
         """
-        if self._is_sound_playing():
+        if not self._ensure_mixer():
             return False
+        if preempt:
+            self.stop_current_sound()
 
         try:
-            self.current_sound_channel.play(sound)
+            channel = pygame.mixer.find_channel(True)
+            channel.play(sound)
+            self.current_sound_channel = channel
             return True
         except Exception as e:
             print(f"Error playing sound: {e}")
@@ -158,11 +268,12 @@ class SoundManager:
         Returns:
             True if sound was played, False otherwise.
         """
-        if sound_name not in self.sound_cache:
-            print(f"Sound '{sound_name}' not found in cache.")
+        sound = self._get_sound(sound_name)
+        if sound is None:
+            print(f"Sound '{sound_name}' not found.")
             return False
 
-        return self._play_sound(self.sound_cache[sound_name])
+        return self._play_sound(sound)
 
     def play_random_from_group(self, group_name: str) -> bool:
         """Play a random sound from a named sound group.
@@ -173,85 +284,95 @@ class SoundManager:
         Returns:
             True if sound was played, False otherwise.
         """
-        if group_name not in self.sound_groups:
-            print(f"Sound group '{group_name}' not found.")
+        # a single lookup resolves the group; the checks below only run on misses
+        available_sounds = self._available_by_group.get(group_name)
+        if not available_sounds:
+            if group_name not in self.sound_groups:
+                print(f"Sound group '{group_name}' not found.")
+            elif not self.sound_groups[group_name]:
+                print(f"Sound group '{group_name}' is empty.")
+            else:
+                print(f"No available sounds in group '{group_name}'.")
             return False
 
-        sound_names = self.sound_groups[group_name]
-        if not sound_names:
-            print(f"Sound group '{group_name}' is empty.")
-            return False
+        return self._play_random_tup(available_sounds)
 
-        # Filter to only available sounds
-        available_sounds = [name for name in sound_names if name in self.sound_cache]
+    def _play_random_tup(self, available_sounds: Tuple[str, ...], preempt: bool = False) -> bool:
+        """Play one sound picked from a tuple of available sound names."""
         if not available_sounds:
-            print(f"No available sounds in group '{group_name}'.")
             return False
-
-        sound_name = random.choice(available_sounds)
-        return self._play_sound(self.sound_cache[sound_name])
+        if len(available_sounds) == 1:
+            # single-sound groups need no random pick
+            sound_name = available_sounds[0]
+        else:
+            sound_name = available_sounds[random.randrange(len(available_sounds))]
+        sound = self._get_sound(sound_name)
+        if sound is None:
+            return False
+        return self._play_sound(sound, preempt)
 
     def stop_current_sound(self) -> None:
-        """Stop the currently playing sound."""
-        self.current_sound_channel.stop()
+        """Stop every sound currently playing."""
+        for channel in self._channels:
+            channel.stop()
 
     # ==================== Event-based sound triggers ====================
 
     def on_move_command(self) -> bool:
         """Play sound when a unit receives a move command."""
-        return self.play_random_from_group("MOVE_COMMAND")
+        return self._play_random_tup(self._groups_by_id[SndEvt.MOVE_COMMAND])
 
     def on_dock_command(self) -> bool:
         """Play sound when a unit receives a dock command."""
-        return self.play_random_from_group("DOCK_COMMAND")
+        return self._play_random_tup(self._groups_by_id[SndEvt.DOCK_COMMAND])
 
     def on_harvest_command(self) -> bool:
         """Play sound when a unit receives a harvest/collect command."""
-        return self.play_random_from_group("HARVEST_COMMAND")
+        return self._play_random_tup(self._groups_by_id[SndEvt.HARVEST_COMMAND])
 
     def on_repair_command(self) -> bool:
         """Play sound when repairs are started."""
-        return self.play_random_from_group("REPAIR_COMMAND")
+        return self._play_random_tup(self._groups_by_id[SndEvt.REPAIR_COMMAND])
 
     def on_hyperspace_launch(self) -> bool:
         """Play sound when hyperspace jump begins."""
-        return self.play_random_from_group("HYPERSPACE_LAUNCH")
+        return self._play_random_tup(self._groups_by_id[SndEvt.HYPERSPACE_LAUNCH])
 
     def on_hyperspace_complete(self) -> bool:
         """Play sound when hyperspace jump completes and asteroids/station are drawn."""
-        return self.play_random_from_group("HYPERSPACE_COMPLETE")
+        return self._play_random_tup(self._groups_by_id[SndEvt.HYPERSPACE_COMPLETE])
 
     def on_refining_complete(self) -> bool:
         """Play sound when a refinement process completes."""
-        return self.play_random_from_group("REFINING_COMPLETE")
+        return self._play_random_tup(self._groups_by_id[SndEvt.REFINING_COMPLETE])
 
     def on_fabrication_complete(self) -> bool:
         """Play sound when a construction/fabrication process completes."""
-        return self.play_random_from_group("FABRICATION_COMPLETE")
+        return self._play_random_tup(self._groups_by_id[SndEvt.FABRICATION_COMPLETE])
 
     def on_ship_docking(self) -> bool:
         """Play sound when a ship docks or arrives at station."""
-        return self.play_random_from_group("SHIP_DOCKING")
+        return self._play_random_tup(self._groups_by_id[SndEvt.SHIP_DOCKING])
 
     def on_resource_collector_full(self) -> bool:
         """Play sound when a resource collector's inventory is full."""
-        return self.play_random_from_group("RESOURCE_COLLECTOR_FULL")
+        return self._play_random_tup(self._groups_by_id[SndEvt.RESOURCE_COLLECTOR_FULL])
 
     def on_resource_transfer(self) -> bool:
         """Play sound when resources are transferred between units."""
-        return self.play_random_from_group("RESOURCE_TRANSFER")
+        return self._play_random_tup(self._groups_by_id[SndEvt.RESOURCE_TRANSFER])
 
     def on_unit_destroyed_frigate(self) -> bool:
         """Play sound when a frigate is destroyed."""
-        return self.play_random_from_group("UNIT_DESTROYED_FRIGATE")
+        return self._play_random_tup(self._groups_by_id[SndEvt.UNIT_DESTROYED_FRIGATE], preempt=True)
 
     def on_unit_destroyed_collector(self) -> bool:
         """Play sound when a resource collector is destroyed."""
-        return self.play_random_from_group("UNIT_DESTROYED_COLLECTOR")
+        return self._play_random_tup(self._groups_by_id[SndEvt.UNIT_DESTROYED_COLLECTOR], preempt=True)
 
     def on_unit_destroyed_strikegroup(self) -> bool:
         """Play sound when a strike group is destroyed."""
-        return self.play_random_from_group("UNIT_DESTROYED_STRIKEGROUP")
+        return self._play_random_tup(self._groups_by_id[SndEvt.UNIT_DESTROYED_STRIKEGROUP], preempt=True)
 
     # ==================== Utility methods ====================
 
@@ -260,21 +381,23 @@ class SoundManager:
         return list(self.sound_groups.keys())
 
     def get_cached_sounds(self) -> List[str]:
-        """Get a list of all currently cached sound names."""
+        """Get a list of all sound names decoded so far."""
         return list(self.sound_cache.keys())
 
     def set_volume(self, volume: float) -> None:
-        """Set the volume for the current channel.
+        """Set the volume for all playback channels.
 
         Args:
             volume: Volume level from 0.0 (silent) to 1.0 (full).
         """
         volume = max(0.0, min(1.0, volume))
-        self.current_sound_channel.set_volume(volume)
+        self._volume = volume
+        for channel in self._channels:
+            channel.set_volume(volume)
 
     def get_volume(self) -> float:
-        """Get the current channel volume."""
-        return self.current_sound_channel.get_volume()
+        """Get the channel volume."""
+        return self._volume
 
 
 # Global singleton instance
@@ -0,0 +1,61 @@
+"""Uniform-grid spatial hash used as a collision broad phase.
+
+`Grid` buckets ships by the cells their sprite rect overlaps so callers
+only run the expensive pixel tests against ships near a query rect,
+instead of against every ship in a fleet.
+"""
+
+from typing import Dict, List, Tuple
+
+
+class Grid:
+    """Spatial hash keyed by `(x // cell, y // cell)`.
+
+    Call `rebuild(ships)` once per frame, then `query(rect)` any number of
+    times. Results come back in the order the ships were passed to
+    `rebuild`, so "first hit wins" logic behaves as with a plain list scan.
+    """
+
+    def __init__(self, cell: int = 128):
+        self.cell = int(cell)
+        self._cells: Dict[Tuple[int, int], List[int]] = {}
+        self._ships: list = []
+
+    def rebuild(self, ships):
+        """Re-bucket `ships` by their current rotated sprite rect."""
+        cell = self.cell
+        cells = {}
+        self._ships = list(ships)
+        for idx, ship in enumerate(self._ships):
+            surf, _ = ship.get_rotated_sprite()
+            rect = ship.get_sprite_rect(surf)
+            for cx in range(rect.left // cell, (rect.right - 1) // cell + 1):
+                for cy in range(rect.top // cell, (rect.bottom - 1) // cell + 1):
+                    bucket = cells.get((cx, cy))
+                    if bucket is None:
+                        cells[(cx, cy)] = [idx]
+                    else:
+                        bucket.append(idx)
+        self._cells = cells
+
+    def query(self, rect) -> list:
+        """Return the ships whose cells overlap `rect`, in rebuild order."""
+        cell = self.cell
+        cells = self._cells
+        x0, x1 = rect.left // cell, (rect.right - 1) // cell
+        y0, y1 = rect.top // cell, (rect.bottom - 1) // cell
+        if x0 == x1 and y0 == y1:
+            # common case: a small rect inside a single cell
+            found = cells.get((x0, y0))
+            if not found:
+                return []
+            ships = self._ships
+            return [ships[i] for i in found]
+        hits = set()
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    hits.update(bucket)
+        ships = self._ships
+        return [ships[i] for i in sorted(hits)]
@@ -1,48 +1,87 @@
 import random
-import pygame
 from spacegame.core.projectile import Projectile
+from spacegame.core.spatial import Grid
 from spacegame.models.units.pirate_frigate import PirateFrigate
 
 
+# Spawn point generators indexed by screen edge; each takes
+# (width, height, margin) and returns a point just off that edge.
+_EDGE_SPAWNERS = (
+    # top
+    lambda w, h, m: (random.uniform(m, w - m), -random.uniform(20, 120)),
+    # right
+    lambda w, h, m: (w + random.uniform(20, 120), random.uniform(m, h - m)),
+    # bottom
+    lambda w, h, m: (random.uniform(m, w - m), h + random.uniform(20, 120)),
+    # left
+    lambda w, h, m: (-random.uniform(20, 120), random.uniform(m, h - m)),
+)
+
+
 def spawn_enemy_wave(width, height, location_data, enemy_group, enemy_fleet, count=1):
     """Spawn `count` PirateFrigate enemies at random edge positions and add them to groups."""
     margin = 40
     for _ in range(max(1, count)):
-        edge = random.randrange(4)
-        if edge == 0:  # top
-            x = random.uniform(margin, width - margin)
-            y = -random.uniform(20, 120)
-        elif edge == 1:  # right
-            x = width + random.uniform(20, 120)
-            y = random.uniform(margin, height - margin)
-        elif edge == 2:  # bottom
-            x = random.uniform(margin, width - margin)
-            y = height + random.uniform(20, 120)
-        else:  # left
-            x = -random.uniform(20, 120)
-            y = random.uniform(margin, height - margin)
+        x, y = _EDGE_SPAWNERS[random.randrange(4)](width, height, margin)
 
         new_enemy = PirateFrigate((x, y))
         enemy_fleet.append(new_enemy)
-        if isinstance(new_enemy, pygame.sprite.Sprite):
-            enemy_group.add(new_enemy)
+        enemy_group.add(new_enemy)
 
 
 def handle_auto_fire(source_fleet, target_fleet, projectile_group, owner_is_enemy=False, color=(255, 240, 120), speed_factor=1.0):
     """Auto-fire helper: iterate source_fleet and spawn projectiles toward nearest targets in target_fleet.
     `speed_factor` multiplies `Projectile.SPEED` when constructing enemy projectiles.
+
+    Both fleets hold `SpaceUnit`s, which always define the weapon stats and
+    cooldown helpers used here.
     """
     if not target_fleet:
         return
-    for s in source_fleet:
-        if getattr(s, 'bullet_damage', 0) <= 0:
-            continue
-        nearest = min(target_fleet, key=lambda e: (e.pos - s.pos).length_squared())
-        if s.is_target_in_range(nearest) and s.ready_to_fire():
+    shooters = [s for s in source_fleet if s.bullet_damage > 0 and s.ready_to_fire()]
+    if not shooters:
+        return
+
+    # Bucket targets on a grid whose cell is at least the longest reach
+    # (fire range + target radius). Any target outside a shooter's 3x3 cell
+    # block is then out of range, and can't be nearer than an in-range
+    # target inside it, so scanning the block gives the same firing
+    # decision as scanning the whole fleet.
+    cell = max(s.fire_range for s in shooters) + max(e.bounding_radius() for e in target_fleet)
+    cell = max(1.0, cell)
+    # target coordinates as flat float lists (SoA) so the distance loop
+    # below indexes plain floats instead of chasing e.pos per candidate
+    tx = [e.pos.x for e in target_fleet]
+    ty = [e.pos.y for e in target_fleet]
+    grid = {}
+    for idx in range(len(tx)):
+        key = (int(tx[idx] // cell), int(ty[idx] // cell))
+        bucket = grid.get(key)
+        if bucket is None:
+            grid[key] = [idx]
+        else:
+            bucket.append(idx)
+
+    for s in shooters:
+        sx = s.pos.x
+        sy = s.pos.y
+        cx = int(sx // cell)
+        cy = int(sy // cell)
+        best = None
+        for gx in (cx - 1, cx, cx + 1):
+            for gy in (cy - 1, cy, cy + 1):
+                for idx in grid.get((gx, gy), ()):
+                    dx = tx[idx] - sx
+                    dy = ty[idx] - sy
+                    d2 = (dx * dx + dy * dy, idx)  # ties go to fleet order, like min()
+                    if best is None or d2 < best:
+                        best = d2
+        if best is not None and s.is_target_in_range(target_fleet[best[1]]):
+            nearest = target_fleet[best[1]]
             dirv = (nearest.pos - s.pos)
             kwargs = {
                 'hull_damage': s.bullet_damage,
-                'armor_damage': getattr(s, 'armor_damage', 0),
+                'armor_damage': s.armor_damage,
                 'color': color,
                 'owner_is_enemy': owner_is_enemy,
             }
@@ -51,51 +90,32 @@ def handle_auto_fire(source_fleet, target_fleet, projectile_group, owner_is_enem
 
             proj = Projectile(s.pos, dirv, **kwargs)
             projectile_group.add(proj)
-            try:
-                s.reset_cooldown()
-            except Exception:
-                pass
+            s.reset_cooldown()
 
 
 def handle_projectile_collisions(projectile_group, player_fleet, enemy_fleet):
-    """Resolve projectile collisions and apply damage to fleets."""
-    for proj in list(projectile_group):
-        try:
-            if getattr(proj, 'owner_is_enemy', False):
-                for p in player_fleet:
-                    if proj.collides_with_shape(p):
-                        if getattr(p, 'max_armor', 0) > 0 and getattr(p, 'armor', 0) > 0:
-                            p.take_armor_damage(proj.armor_damage)
-                        else:
-                            p.take_damage(proj.hull_damage)
-                        try:
-                            proj.explode()
-                        except Exception:
-                            try:
-                                proj.kill()
-                            except Exception:
-                                pass
-                        break
-            else:
-                for e in enemy_fleet:
-                    if proj.collides_with_shape(e):
-                        if getattr(e, 'max_armor', 0) > 0 and getattr(e, 'armor', 0) > 0:
-                            e.take_armor_damage(proj.armor_damage)
-                        else:
-                            e.take_damage(proj.hull_damage)
-                        try:
-                            proj.explode()
-                        except Exception:
-                            try:
-                                proj.kill()
-                            except Exception:
-                                pass
-                        break
-        except Exception:
-            try:
-                proj.explode()
-            except Exception:
-                try:
-                    proj.kill()
-                except Exception:
-                    pass
+    """Resolve projectile collisions and apply damage to fleets.
+
+    Fleet members are `SpaceUnit`s, so `armor`/`max_armor` are always set.
+    """
+    # Broad phase: bucket each fleet once so projectiles only test nearby ships
+    player_grid = Grid()
+    player_grid.rebuild(player_fleet)
+    enemy_grid = Grid()
+    enemy_grid.rebuild(enemy_fleet)
+    # Projectiles that hit are collected and removed from the group in one
+    # batch after the loop instead of a kill() per hit.
+    dead = []
+    for proj in projectile_group:
+        grid = player_grid if proj.owner_is_enemy else enemy_grid
+        for ship in grid.query(proj.rect):
+            if proj.collides_with_shape(ship):
+                if ship.max_armor > 0 and ship.armor > 0:
+                    ship.take_armor_damage(proj.armor_damage)
+                else:
+                    ship.take_damage(proj.hull_damage)
+                proj.spawn_impact()
+                dead.append(proj)
+                break
+    if dead:
+        projectile_group.remove(*dead)
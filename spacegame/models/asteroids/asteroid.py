@@ -1,38 +1,98 @@
 from abc import ABC
 import pygame
 from pygame.math import Vector2
+from spacegame.config import IMAGES_DIR
 
 
 class Asteroid(pygame.sprite.Sprite, ABC):
     """Abstract asteroid: position, tier, ore_type (letter), purity (0..1), and radius.
 
-    Subclasses should call `self.set_sprite(surface)` after creating a scaled
-    surface for the asteroid so that the sprite image/rect/mask are initialized.
+    Subclasses should call `self.load_sprite(filename)` (or `self.set_sprite(surface)`
+    with a pre-scaled surface) so that the sprite image/rect/mask are initialized.
     """
 
-    def __init__(self, pos, tier: int, ore_type: str, purity: float, radius: int = 28):
+    # pygame's Sprite still carries a __dict__ (group bookkeeping and its own
+    # image/rect properties), but the asteroid's fields live in slots for
+    # compact storage and fast access.
+    __slots__ = ('pos', 'tier', 'ore_type', 'purity', 'radius', '_radius_sq', '_mask', '_sprite_key')
+
+    # (filename, diameter) -> scaled surface / mask, shared by every asteroid
+    # using that sprite; asteroids never modify their image or mask. Masks
+    # are only built the first time something asks for one.
+    _SPRITE_CACHE = {}
+    _MASK_CACHE = {}
+
+    def __init__(self, pos, tier: int, ore_type: str, purity: float, radius: int = 28, _defer_rect: bool = False):
         pygame.sprite.Sprite.__init__(self)
         self.pos = Vector2(pos)
         self.tier = int(tier)
         self.ore_type = str(ore_type)
         self.purity = float(purity)
         self.radius = int(radius)
+        self._radius_sq = self.radius * self.radius
         self.image = None
-        self.rect = pygame.Rect(int(self.pos.x - self.radius), int(self.pos.y - self.radius), self.radius * 2, self.radius * 2)
-        self.mask = None
+        # subclasses that assign a sprite right away pass _defer_rect and
+        # only fall back to _default_rect() if loading the sprite fails
+        self.rect = None if _defer_rect else self._default_rect()
+        self._mask = None
+        self._sprite_key = None
+
+    def _default_rect(self) -> pygame.Rect:
+        """Square rect covering the asteroid's radius, for sprite-less asteroids."""
+        return pygame.Rect(int(self.pos.x - self.radius), int(self.pos.y - self.radius), self.radius * 2, self.radius * 2)
+
+    @property
+    def mask(self):
+        """Pixel mask of the sprite, built on first access."""
+        if self._mask is None and self.image is not None:
+            key = self._sprite_key
+            mask = Asteroid._MASK_CACHE.get(key) if key is not None else None
+            if mask is None:
+                mask = pygame.mask.from_surface(self.image)
+                if key is not None:
+                    Asteroid._MASK_CACHE[key] = mask
+            self._mask = mask
+        return self._mask
+
+    @mask.setter
+    def mask(self, value):
+        self._mask = value
 
     def set_sprite(self, surf: pygame.Surface):
-        """Assign the sprite surface and compute rect/mask."""
+        """Assign the sprite surface and rect; the mask is built lazily."""
         self.image = surf
         self.rect = self.image.get_rect(center=(int(self.pos.x), int(self.pos.y)))
-        try:
-            self.mask = pygame.mask.from_surface(self.image)
-        except Exception:
-            self.mask = None
+        self._mask = None
+        self._sprite_key = None
+
+    def load_sprite(self, filename: str):
+        """Assign the sprite `IMAGES_DIR/filename` scaled to this asteroid's diameter.
+
+        The image is loaded and scaled once per (filename, diameter); later
+        asteroids reuse the cached surface (and mask, once one is built).
+        """
+        diameter = max(4, int(self.radius * 2))
+        key = (filename, diameter)
+        surf = Asteroid._SPRITE_CACHE.get(key)
+        if surf is None:
+            surf = pygame.image.load(IMAGES_DIR + "/" + filename).convert_alpha()
+            surf = pygame.transform.smoothscale(surf, (diameter, diameter))
+            Asteroid._SPRITE_CACHE[key] = surf
+        self.image = surf
+        self.rect = surf.get_rect(center=(int(self.pos.x), int(self.pos.y)))
+        self._mask = None
+        self._sprite_key = key
 
     def point_inside(self, point) -> bool:
-        p = Vector2(point)
-        return (p - self.pos).length_squared() <= (self.radius * self.radius)
+        # per-axis bounding-box reject first; most tested points are far away
+        radius = self.radius
+        dx = point[0] - self.pos.x
+        if dx > radius or dx < -radius:
+            return False
+        dy = point[1] - self.pos.y
+        if dy > radius or dy < -radius:
+            return False
+        return dx * dx + dy * dy <= self._radius_sq
 
     def bounding_radius(self) -> float:
         return float(self.radius)
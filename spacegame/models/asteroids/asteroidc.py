@@ -1,6 +1,4 @@
-import pygame
 from spacegame.models.asteroids.asteroid import Asteroid
-from spacegame.config import IMAGES_DIR
 
 class MineableAsteroidC(Asteroid):
     """Mineable asteroid that yields RU TYPE C ore.
@@ -8,14 +6,12 @@ class MineableAsteroidC(Asteroid):
     Purity is a float between 0.0 and 1.0 (e.g. 0.5 means 50% yield).
     """
 
+    __slots__ = ()
+
     def __init__(self, pos, tier: int = 0, purity: float = 0.5):
-        super().__init__(pos, tier=tier, ore_type="C", purity=purity, radius=34)
+        super().__init__(pos, tier=tier, ore_type="C", purity=purity, radius=34, _defer_rect=True)
         # Try to load asteroid sprite; scale to asteroid radius if possible.
         try:
-            surf = pygame.image.load(IMAGES_DIR + "/AsteroidRUCOre.png").convert_alpha()
-            # scale to diameter
-            diameter = max(4, int(self.radius * 2))
-            surf = pygame.transform.smoothscale(surf, (diameter, diameter))
-            self.set_sprite(surf)
+            self.load_sprite("AsteroidRUCOre.png")
         except Exception:
-            pass
\ No newline at end of file
+            self.rect = self._default_rect()
\ No newline at end of file
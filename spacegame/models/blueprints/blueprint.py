@@ -5,10 +5,18 @@ class Blueprint(ABC):
     """Abstract base for blueprint-like inventory items.
 
     Blueprints are stackable in principle, but some may be infinite
-    (represented by quantity=float('inf')). Concrete blueprints should
-    provide `name`, `tier`, and `preview_filename` properties.
+    (represented by quantity=Blueprint.INFINITE). Concrete blueprints should
+    provide `name`, `tier`, and `preview_filename` (constant values may be
+    plain class attributes).
     """
 
+    # Per-instance state only; constant data lives on the concrete classes.
+    __slots__ = ('tier', 'stack_size', 'quantity', 'rarity', 'title', 'description')
+
+    # Sentinel quantity for unlimited blueprints; an int keeps stock
+    # arithmetic and comparisons free of float boxing.
+    INFINITE = 2 ** 62
+
     def __init__(self, tier: int = 0, stack_size: int = 9999, quantity=None, rarity: str = "COMMON", title: str | None = None, description: str = "",):
         self.tier = int(tier)
         self.stack_size = int(stack_size)
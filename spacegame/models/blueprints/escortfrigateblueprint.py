@@ -8,11 +8,23 @@ class BPEscortFrigate(Blueprint):
     Uses the Resource Collector preview temporarily as requested.
     """
 
+    __slots__ = ()
+
+    name = "Escort Frigate Blueprint"
+    # use resource collector BP image temporarily
+    preview_filename = "BPResourceCollectorPreview.png"
+
+    unit_class = Frigate
+    required_ore_letter = "M"
+    # Cost as requested: 1125 M-type ore
+    required_ore_amount = 1125
+    base_fabrication_time = 20
+
     def __init__(self):
         super().__init__(
             tier=0,
             stack_size=9999,
-            quantity=float("inf"),
+            quantity=Blueprint.INFINITE,
             rarity="COMMON",
             title="ESCORT\nFRIGATE",
             description=(
@@ -20,18 +32,7 @@ class BPEscortFrigate(Blueprint):
             ),
         )
 
-        self.unit_class = Frigate
-        self.required_ore_letter = "M"
-        self.required_ore_tier = self.tier
-        # Cost as requested: 1125 M-type ore
-        self.required_ore_amount = 1125
-        self.base_fabrication_time = 20
-
-    @property
-    def name(self) -> str:
-        return "Escort Frigate Blueprint"
-
     @property
-    def preview_filename(self) -> str:
-        # use resource collector BP image temporarily
-        return "BPResourceCollectorPreview.png"
+    def required_ore_tier(self) -> int:
+        # ore tier follows the blueprint's own tier
+        return self.tier
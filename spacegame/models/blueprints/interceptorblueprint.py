@@ -7,11 +7,21 @@ class BPInterceptor(Blueprint):
     Preview image expected at `spacegame/assets/previews/BPInterceptorPreview.png`.
     """
 
+    __slots__ = ()
+
+    name = "Interceptor Blueprint"
+    preview_filename = "BPInterceptorPreview.png"
+
+    unit_class = Interceptor
+    required_ore_letter = "M"
+    required_ore_amount = 625
+    base_fabrication_time = 9
+
     def __init__(self):
         super().__init__(
             tier=0,
             stack_size=9999,
-            quantity=float("inf"),
+            quantity=Blueprint.INFINITE,
             rarity="COMMON",
             title="INTERCEPTOR\nSQUADRON",
             description=(
@@ -21,16 +31,7 @@ class BPInterceptor(Blueprint):
             ),
         )
 
-        self.unit_class = Interceptor
-        self.required_ore_letter = "M"
-        self.required_ore_tier = self.tier
-        self.required_ore_amount = 625
-        self.base_fabrication_time = 9
-
-    @property
-    def name(self) -> str:
-        return "Interceptor Blueprint"
-
     @property
-    def preview_filename(self) -> str:
-        return "BPInterceptorPreview.png"
+    def required_ore_tier(self) -> int:
+        # ore tier follows the blueprint's own tier
+        return self.tier
@@ -8,11 +8,22 @@ class BPPlasmaBomber(Blueprint):
     Preview image expected at `spacegame/assets/previews/BPPlasmaBomberPreview.png`.
     """
 
+    __slots__ = ()
+
+    name = "Plasma Bomber Blueprint"
+    preview_filename = "BPBomberPreview.png"
+
+    unit_class = PlasmaBomber
+    required_ore_letter = "M"
+    # Cost chosen to be larger than a single interceptor squadron
+    required_ore_amount = 625
+    base_fabrication_time = 12
+
     def __init__(self):
         super().__init__(
             tier=0,
             stack_size=9999,
-            quantity=float("inf"),
+            quantity=Blueprint.INFINITE,
             rarity="COMMON",
             title="PLASMA\nBOMBER",
             description=(
@@ -21,17 +32,7 @@ class BPPlasmaBomber(Blueprint):
             ),
         )
 
-        self.unit_class = PlasmaBomber
-        self.required_ore_letter = "M"
-        self.required_ore_tier = self.tier
-        # Cost chosen to be larger than a single interceptor squadron
-        self.required_ore_amount = 625
-        self.base_fabrication_time = 12
-
-    @property
-    def name(self) -> str:
-        return "Plasma Bomber Blueprint"
-
     @property
-    def preview_filename(self) -> str:
-        return "BPBomberPreview.png"
+    def required_ore_tier(self) -> int:
+        # ore tier follows the blueprint's own tier
+        return self.tier
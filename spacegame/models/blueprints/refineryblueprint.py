@@ -7,11 +7,20 @@ class BPRefinery(Blueprint):
     Preview image expected at `spacegame/assets/previews/BPRefineryPreview.png`.
     """
 
+    # cost mapping is per instance; a class-level dict would be shared by all
+    __slots__ = ('required_resources',)
+
+    name = "Refinery Module Blueprint"
+    preview_filename = "BPRefineryPreview.png"
+
+    # Base fabrication time in seconds (5 minutes)
+    base_fabrication_time = 300
+
     def __init__(self):
         super().__init__(
             tier=1,
             stack_size=9999,
-            quantity=float("inf"),
+            quantity=Blueprint.INFINITE,
             rarity="COMMON",
             title="REFINERY\nMODULE",
             description=(
@@ -26,14 +35,3 @@ class BPRefinery(Blueprint):
             "M": 1000,      # M ore
             "C": 1750,     # Tier 1 Refined C
         }
-        
-        # Base fabrication time in seconds (5 minutes)
-        self.base_fabrication_time = 300
-
-    @property
-    def name(self) -> str:
-        return "Refinery Module Blueprint"
-
-    @property
-    def preview_filename(self) -> str:
-        return "BPRefineryPreview.png"
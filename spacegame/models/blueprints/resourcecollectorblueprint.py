@@ -8,11 +8,22 @@ class BPResourceCollector(Blueprint):
     Preview image expected at `spacegame/assets/previews/BPResourceCollectorPreview.png`.
     """
 
+    __slots__ = ()
+
+    name = "Resource Collector Blueprint"
+    preview_filename = "BPResourceCollectorPreview.png"
+
+    unit_class = ResourceCollector
+    required_ore_letter = "M"
+    # Fabrication cost: 75 M-type ore
+    required_ore_amount = 75
+    base_fabrication_time = 6
+
     def __init__(self):
         super().__init__(
             tier=0,
             stack_size=9999,
-            quantity=float("inf"),
+            quantity=Blueprint.INFINITE,
             rarity="COMMON",
             title="RESOURCE\nCOLLECTOR",
             description=(
@@ -21,17 +32,7 @@ class BPResourceCollector(Blueprint):
             ),
         )
 
-        self.unit_class = ResourceCollector
-        self.required_ore_letter = "M"
-        self.required_ore_tier = self.tier
-        # Fabrication cost: 75 M-type ore
-        self.required_ore_amount = 75
-        self.base_fabrication_time = 6
-
-    @property
-    def name(self) -> str:
-        return "Resource Collector Blueprint"
-
     @property
-    def preview_filename(self) -> str:
-        return "BPResourceCollectorPreview.png"
+    def required_ore_tier(self) -> int:
+        # ore tier follows the blueprint's own tier
+        return self.tier
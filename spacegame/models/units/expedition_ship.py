@@ -69,6 +69,9 @@ class ExpeditionShip(SpaceUnit):
 
         # Remember the last selected light craft for convenience in input handling.
         self.last_selected_light_craft = None
+        # Escort frigate in this ship's fleet, if any (set by the game screen,
+        # cleared when it is destroyed) so the HUD needn't scan the fleet.
+        self.frigate = None
         # Per-section capacity limits for internal modules (persisted on the ship)
         # Order: [left-section, middle-section, right-section]
         self.internal_section_capacity_limits = [170, 220, 170]
@@ -74,6 +74,9 @@ class SpaceUnit(pygame.sprite.Sprite, ABC):
         self._last_angle_for_mask = None
         self._last_mask = None
         self._last_rot_surf = None
+        # cache for the rect of the rotated surface at the last position
+        self._last_rect = None
+        self._last_rect_center = None
 
         # initialize sprite image/rect/mask
         self.image = self.base_surf.copy()
@@ -138,15 +141,27 @@ class SpaceUnit(pygame.sprite.Sprite, ABC):
     # --------------- Helpers ---------------
     def get_rotated_sprite(self):
         # Return rotated surface at current angle (may reuse cached surf/mask).
-        if self._last_angle_for_mask != self.angle or self._last_rot_surf is None:
-            self._last_rot_surf = pygame.transform.rotate(self.base_surf, self.angle)
+        # Angles are snapped to whole degrees so slow turns and every
+        # projectile/ship test within a frame hit the same cached rotation.
+        angle = round(self.angle)
+        if self._last_angle_for_mask != angle or self._last_rot_surf is None:
+            self._last_rot_surf = pygame.transform.rotate(self.base_surf, angle)
             self._last_mask = pygame.mask.from_surface(self._last_rot_surf)
-            self._last_angle_for_mask = self.angle
+            self._last_angle_for_mask = angle
+            self._last_rect = None
         return self._last_rot_surf, self._last_mask
 
     def get_sprite_rect(self, surf):
-        # Return rect of given surface centered at current position (always recomputed).
-        return surf.get_rect(center=(int(self.pos.x), int(self.pos.y)))
+        # Return rect of given surface centered at current position.
+        # The rect for the cached rotated surface is reused until the ship moves;
+        # callers must treat it as read-only.
+        center = (int(self.pos.x), int(self.pos.y))
+        if surf is not self._last_rot_surf:
+            return surf.get_rect(center=center)
+        if self._last_rect is None or self._last_rect_center != center:
+            self._last_rect = surf.get_rect(center=center)
+            self._last_rect_center = center
+        return self._last_rect
 
     def update(self, dt: float = 0.016):
         # Keep sprite image/rect/mask in sync with mover/rotation
@@ -185,7 +200,9 @@ class SpaceUnit(pygame.sprite.Sprite, ABC):
         This matches the previous in_range(a, b, r) helper from gameScreen.py.
         """
         r = radius if radius is not None else self.fire_range
-        dist2 = (self.pos - other.pos).length_squared()
+        dx = self.pos.x - other.pos.x
+        dy = self.pos.y - other.pos.y
+        dist2 = dx * dx + dy * dy
         eff_r = r + other.bounding_radius()
         return dist2 <= eff_r * eff_r
 
@@ -4,6 +4,15 @@ from spacegame.config import IMAGES_DIR
 from spacegame.core.effects import spawn_dust
 from spacegame.core.sound_manager import get_sound_manager
 
+# Interaction ranges (pixels). The squares are module globals so the
+# per-frame range checks compare against them without an attribute lookup.
+_HEAL_RANGE = 60.0
+_MINE_RANGE = 60.0
+_UNLOAD_RANGE = 60.0
+_HEAL_RANGE_SQ = _HEAL_RANGE * _HEAL_RANGE
+_MINE_RANGE_SQ = _MINE_RANGE * _MINE_RANGE
+_UNLOAD_RANGE_SQ = _UNLOAD_RANGE * _UNLOAD_RANGE
+
 
 class ResourceCollector(SpaceUnit):
     """Deployable support craft that can heal allied ships and mine asteroids.
@@ -13,9 +22,40 @@ class ResourceCollector(SpaceUnit):
     - Mining: extract ore from asteroids, carry it, and unload at the mothership.
     """
 
+    # SpaceUnit/Sprite instances keep a __dict__, but the collector's own
+    # per-frame state lives in slots for faster attribute access.
+    __slots__ = (
+        'tier', 'base_surf', 'collector_id', 'recalling', 'hangar_slot', 'mothership', 'state',
+        'healing_target', 'mining_target', 'mining_fill', 'mining_capacity',
+        'returning_to_ship', '_pending_delivery',
+        '_mining_pct', '_bar_w', '_mining_bar_key', '_mining_bar_geom',
+    )
+
+    # Activity states; `state` says which update (if any) needs to run
+    STATE_IDLE, STATE_HEAL, STATE_MINE, STATE_RETURN = 0, 1, 2, 3
+
     # Healing configuration: amount healed per second and effective range (pixels)
     HEAL_RATE = 15.0
-    HEAL_RANGE = 60.0
+    HEAL_RANGE = _HEAL_RANGE
+
+    # Mining configuration: fill rate at the asteroid and unload rate at the
+    # mothership (per second), and the distance each needs (pixels)
+    MINE_RATE = 10.0
+    UNLOAD_RATE = 75.0
+    MINE_RANGE = _MINE_RANGE
+    UNLOAD_RANGE = _UNLOAD_RANGE
+
+    # Scaled sprite shared by every collector; built on first construction.
+    _BASE_SURF = None
+
+    @classmethod
+    def _get_base_surf(cls) -> pygame.Surface:
+        """Load, orient, and scale the collector sprite once; later calls reuse it."""
+        if cls._BASE_SURF is None:
+            sprite = pygame.image.load(IMAGES_DIR + "/ResourceCollector.png").convert_alpha()
+            sprite = pygame.transform.rotate(sprite, -90)
+            cls._BASE_SURF = pygame.transform.smoothscale(sprite, (sprite.get_width() // 24, sprite.get_height() // 24))
+        return cls._BASE_SURF
 
     def shape_id(self):
         return "resource_collector"
@@ -28,10 +68,8 @@ class ResourceCollector(SpaceUnit):
         # per-instance tier (default 0)
         self.tier = tier
 
-        # Load, orient, and scale the collector sprite used for rendering.
-        sprite = pygame.image.load(IMAGES_DIR + "/ResourceCollector.png").convert_alpha()
-        sprite = pygame.transform.rotate(sprite, -90)
-        scaled_sprite = pygame.transform.smoothscale(sprite, (sprite.get_width() // 24, sprite.get_height() // 24))
+        # Shared, pre-scaled collector sprite used for rendering.
+        scaled_sprite = ResourceCollector._get_base_surf()
 
         # Initialize base visual / collision size from the scaled sprite.
         super().__init__(start_pos, ship_size=scaled_sprite.get_size(), rarity="common", **kwargs)
@@ -55,25 +93,37 @@ class ResourceCollector(SpaceUnit):
         self.max_armor = 210.0
         self.armor = self.max_armor
 
+        # Current activity (one of the STATE_* constants)
+        self.state = self.STATE_IDLE
+
         # Healing state: target ship to heal (or None)
         self.healing_target = None
 
-        # Mining state: current asteroid, carried fill and rates/capacity
+        # Mining state: current asteroid, carried fill and capacity
         self.mining_target = None
         self.mining_fill = 0.0
         self.mining_capacity = 150.0
-        self.MINE_RATE = 10.0
-        self.MINE_RANGE = 60.0
+        # fill / capacity in [0, 1], updated wherever the fill changes
+        self._mining_pct = 0.0
         self.returning_to_ship = False
-        self.UNLOAD_RATE = 75.0
+        # (ore_type, amount) fixed when the hold fills; delivered on unload
+        self._pending_delivery = None
 
         # Visual overlay radius used by UI; keep in sync with heal range
         self.fire_range = float(self.HEAL_RANGE)
 
+        # Overlay bar width; ship_size is fixed for the unit's lifetime
+        self._bar_w = max(40, min(140, int(self.ship_size[0])))
+
+        # (angle, x, y) -> mining bar geometry from the last draw_overlay
+        self._mining_bar_key = None
+        self._mining_bar_geom = None
+
     def start_healing(self, target):
         """Set the target ship to heal. This will cancel any previous healing."""
         self.cancel_mining()
         self.healing_target = target
+        self.state = self.STATE_HEAL
         # Navigate to the target
         self.mover.set_target(target.pos)
         # Play repair command sound
@@ -86,52 +136,99 @@ class ResourceCollector(SpaceUnit):
     def cancel_healing(self):
         """Cancel the current healing operation."""
         self.healing_target = None
+        if self.state == self.STATE_HEAL:
+            self.state = self.STATE_IDLE
 
     def is_healing(self) -> bool:
         """Return True if actively healing a target."""
         return self.healing_target is not None
 
-    def update_healing(self, dt: float) -> None:
-        """Update healing state: navigate to target, heal when in range, apply damage/armor healing."""
-        if self.healing_target is None:
+    def update_healing(self, heal_per_frame: float, px: float, py: float) -> None:
+        """Update healing state: navigate to target, heal when in range, apply damage/armor healing.
+
+        `px`, `py` are this collector's position, unpacked once by update_activity.
+        """
+        target = self.healing_target
+        if target is None:
             return
 
         # Check if target is still alive
-        if self.healing_target.health <= 0.0:
+        if target.health <= 0.0:
             self.cancel_healing()
             return
 
-        # Distance to target
-        dist = (self.healing_target.pos - self.pos).length()
+        # Squared distance to target
+        tp = target.pos
+        dx = tp.x - px
+        dy = tp.y - py
 
         # If close enough, heal and stop moving; otherwise navigate
-        if dist <= self.HEAL_RANGE:
-            # Stop moving by setting target to current position
-            self.mover.set_target(self.pos)
+        if dx * dx + dy * dy <= _HEAL_RANGE_SQ:
+            # Stop moving and hold position
+            self.mover.stop()
             # Apply healing to the target
-            self._apply_healing(self.healing_target, dt)
+            self._apply_healing(target, heal_per_frame)
         else:
             # Keep navigating to target
-            self.mover.set_target(self.healing_target.pos)
+            self.mover.set_target(tp)
 
-    def _apply_healing(self, target, dt: float) -> None:
-        """Apply healing over time to the target's health and armor."""
-        heal_amount = self.HEAL_RATE * dt
+    def _apply_healing(self, target, heal_amount: float) -> None:
+        """Apply one frame's `heal_amount` to the target's armor, then health."""
 
-        # Heal armor first if it exists and is damaged
-        if getattr(target, "max_armor", 0) > 0:
-            armor_deficit = target.max_armor - target.armor
+        # Heal armor first if it exists and is damaged (every SpaceUnit
+        # defines max_armor; it is 0 for unarmored ships)
+        max_armor = target.max_armor
+        if max_armor > 0:
+            armor = target.armor
+            armor_deficit = max_armor - armor
             if armor_deficit > 0:
-                armor_heal = min(heal_amount, armor_deficit)
-                target.armor += armor_heal
-                heal_amount -= armor_heal  # Remaining heal goes to health
+                if heal_amount <= armor_deficit:
+                    target.armor = armor + heal_amount
+                    return
+                target.armor = max_armor
+                heal_amount -= armor_deficit  # Remaining heal goes to health
 
         # Heal health if there's remaining heal amount
         if heal_amount > 0:
-            health_deficit = target.max_health - target.health
+            health = target.health
+            health_deficit = target.max_health - health
             if health_deficit > 0:
-                health_heal = min(heal_amount, health_deficit)
-                target.health += health_heal
+                target.health = health + heal_amount if heal_amount < health_deficit else target.max_health
+
+    def update_activity(self, heal_per_frame: float, mine_per_frame: float, unload_per_frame: float) -> None:
+        """Run only the update for the current state; idle collectors return at once.
+
+        The *_per_frame amounts are the class rates times this frame's dt,
+        computed once by update_all. A recall still goes through update_mining
+        so carried ore is dumped.
+        """
+        state = self.state
+        if state == self.STATE_IDLE and not self.recalling:
+            return
+        sp = self.pos
+        px = sp.x
+        py = sp.y
+        if state == self.STATE_HEAL:
+            self.update_healing(heal_per_frame, px, py)
+            if not self.recalling:
+                return
+        self.update_mining(mine_per_frame, unload_per_frame, px, py)
+
+    @classmethod
+    def update_all(cls, ships, dt: float) -> None:
+        """Advance healing and mining for every collector in `ships` in one pass.
+
+        `ships` may be a whole fleet; non-collectors are skipped.
+        """
+        # rates are shared by all collectors, so scale them by dt just once
+        heal_per_frame = cls.HEAL_RATE * dt
+        mine_per_frame = cls.MINE_RATE * dt
+        unload_per_frame = cls.UNLOAD_RATE * dt
+        idle = cls.STATE_IDLE
+        for ship in ships:
+            # same idle test as update_activity, done inline to skip the call
+            if isinstance(ship, cls) and (ship.state != idle or ship.recalling):
+                ship.update_activity(heal_per_frame, mine_per_frame, unload_per_frame)
 
     # ---------- Mining API ----------
     def start_mining(self, asteroid):
@@ -150,6 +247,7 @@ class ResourceCollector(SpaceUnit):
         # Start mining the new asteroid
         self.mining_target = asteroid
         self.returning_to_ship = False
+        self.state = self.STATE_MINE
         # navigate to asteroid
         self.mover.set_target(asteroid.pos)
         
@@ -164,6 +262,9 @@ class ResourceCollector(SpaceUnit):
         """Stop mining operation (keeps collected fill)."""
         self.mining_target = None
         self.returning_to_ship = False
+        self._pending_delivery = None
+        if self.state >= self.STATE_MINE:
+            self.state = self.STATE_IDLE
 
     def is_mining(self) -> bool:
         return (self.mining_target is not None) or (self.mining_fill > 0)
@@ -176,17 +277,24 @@ class ResourceCollector(SpaceUnit):
         """
         self.mining_target = None
         self.mining_fill = 0.0
+        self._mining_pct = 0.0
         self.returning_to_ship = False
+        self._pending_delivery = None
+        if self.state >= self.STATE_MINE:
+            self.state = self.STATE_IDLE
 
-    def update_mining(self, dt: float) -> None:
-        """Update mining state: approach asteroid, fill, return and unload."""
+    def update_mining(self, mine_per_frame: float, unload_per_frame: float, px: float, py: float) -> None:
+        """Update mining state: approach asteroid, fill, return and unload.
+
+        `px`, `py` are this collector's position, unpacked once by update_activity.
+        """
         # If we have no mothership (should be set by Hangar.on_deployed), nothing to do
-        mothership = getattr(self, "mothership", None)
+        mothership = self.mothership
 
         # If we've been ordered to recall, cancel any active mining and go home.
         # We intentionally dump held resources to space (stop_and_dump) so the
         # collector does not try to unload or resume mining before docking.
-        if getattr(self, "recalling", False):
+        if self.recalling:
             # Immediately stop mining and drop carried fill (dump to space)
             try:
                 self.stop_and_dump()
@@ -200,59 +308,71 @@ class ResourceCollector(SpaceUnit):
                 self.mover.set_target(mothership.pos)
 
 
+        # Work on locals and write the mining state back once at the end
+        mt = self.mining_target
+        mover = self.mover
+        fill = self.mining_fill
+        cap = self.mining_capacity
+        rts = self.returning_to_ship
+
         # Active mining at asteroid
-        if self.mining_target is not None and not self.returning_to_ship:
-            # Distance to asteroid
-            dist = (self.mining_target.pos - self.pos).length()
-            if dist <= self.MINE_RANGE:
+        if mt is not None and not rts:
+            # Squared distance to asteroid
+            tp = mt.pos
+            dx = tp.x - px
+            dy = tp.y - py
+            if dx * dx + dy * dy <= _MINE_RANGE_SQ:
                 # Stop moving and mine
-                self.mover.set_target(self.pos)
-                self.mining_fill = min(self.mining_capacity, self.mining_fill + self.MINE_RATE * dt)
+                mover.stop()
+                fill += mine_per_frame
                 # Spawn a small dust cloud at the asteroid while mining
                 try:
                     # match dust parameters used when ships fire projectiles
-                    spawn_dust(self.mining_target.pos, color=(200, 180, 140), count=26, speed=44.0, radius=3.5, lifetime=0.825, scale=1.2)
+                    spawn_dust(tp, color=(200, 180, 140), count=26, speed=44.0, radius=3.5, lifetime=0.825, scale=1.2)
                 except Exception:
                     # Non-fatal: if effects subsystem isn't available, ignore
                     pass
-                # When full, set to return to mothership
-                if self.mining_fill >= self.mining_capacity:
-                    self.mining_fill = self.mining_capacity
+                # When full, clamp and set to return to mothership
+                if fill >= cap:
+                    fill = cap
                     # Play resource collector full sound
                     try:
                         sound_manager = get_sound_manager()
                         sound_manager.on_resource_collector_full()
                     except Exception:
                         pass
-                    self.returning_to_ship = True
+                    # Fix the delivered amount now, using asteroid purity
+                    self._pending_delivery = (mt.ore_type, int(round(cap * float(mt.purity))))
+                    rts = True
                     if mothership is not None:
-                        self.mover.set_target(mothership.pos)
+                        mover.set_target(mothership.pos)
             else:
                 # Navigate to asteroid
-                self.mover.set_target(self.mining_target.pos)
+                mover.set_target(tp)
 
         # Returning to mothership to unload
-        if self.returning_to_ship and mothership is not None:
+        if rts and mothership is not None:
             # steer toward mothership
-            self.mover.set_target(mothership.pos)
+            mp = mothership.pos
+            mover.set_target(mp)
             # If close enough, start unloading
-            dist_ms = (mothership.pos - self.pos).length()
-            if dist_ms <= 60.0:
+            dx = mp.x - px
+            dy = mp.y - py
+            if dx * dx + dy * dy <= _UNLOAD_RANGE_SQ:
                 # unload over time
-                self.mining_fill = max(0.0, self.mining_fill - self.UNLOAD_RATE * dt)
+                fill -= unload_per_frame
+                if fill < 0.0:
+                    fill = 0.0
                 # When emptied, deliver goods and reset
-                if self.mining_fill <= 0.0:
-                    # Determine amount of ore delivered using asteroid purity
-                    if self.mining_target is not None:
-                        amount = int(round(self.mining_capacity * float(self.mining_target.purity)))
+                if fill <= 0.0:
+                    # Deliver the load recorded when the hold filled
+                    pending = self._pending_delivery
+                    if pending is not None:
+                        self._pending_delivery = None
+                        ore_type, amount = pending
                         # Add to mothership inventory via InventoryManager
                         # This intentionally requires a registered InventoryManager on the mothership.
-                        if mothership is None:
-                            raise RuntimeError("ResourceCollector has no mothership to deliver resources to")
-                        inv = getattr(mothership, 'inventory_manager', None)
-                        if inv is None:
-                            raise RuntimeError("Mothership missing InventoryManager; migration required")
-                        inv.add_resource(self.mining_target.ore_type, amount)
+                        mothership.inventory_manager.add_resource(ore_type, amount)
                         # Play resource transfer sound
                         try:
                             sound_manager = get_sound_manager()
@@ -260,42 +380,63 @@ class ResourceCollector(SpaceUnit):
                         except Exception:
                             pass
                     # Reset fill and continue mining loop (go back to asteroid)
-                    self.mining_fill = 0.0
-                    self.returning_to_ship = False
+                    fill = 0.0
+                    rts = False
                     # If there's still a mining target, head back to it to continue mining
-                    if self.mining_target is not None:
-                        self.mover.set_target(self.mining_target.pos)
-
-    # --------------- Drawing ---------------
-    def draw_overlay(self, surface, show_range=False):
-        # Draw overlays (sprite image is handled by sprite groups)
-        super().draw_overlay(surface, show_range=show_range)
-
-        # If currently carrying or filling, draw orange mining meter above health bar
-        if self.mining_fill <= 0.0:
-            return
-
-        # Compute same bar geometry as SpaceUnit.draw_overlay
-        surf, _ = self.get_rotated_sprite()
-        rect = self.get_sprite_rect(surf)
-
-        bar_w = max(40, min(140, int(self.ship_size[0])))
-        bar_h = 6
-        pad = 6
-        bar_x = rect.centerx - bar_w // 2
-        bar_y = rect.top - pad - bar_h
+                    if mt is not None:
+                        mover.set_target(mt.pos)
 
-        # Mining bar sits one bar above the health bar
-        mining_y = bar_y - (bar_h + 4)
+        self.mining_fill = fill
+        self._mining_pct = fill / cap
+        self.returning_to_ship = rts
+        if rts:
+            self.state = self.STATE_RETURN
+        elif self.state >= self.STATE_MINE:
+            self.state = self.STATE_MINE if mt is not None else self.STATE_IDLE
 
-        pct = max(0.0, min(1.0, float(self.mining_fill) / float(self.mining_capacity)))
+    # --------------- Drawing ---------------
+    def _mining_bar_rects(self):
+        """Return (background rect, fill rect or None) for the orange mining meter."""
+        # Compute same bar geometry as SpaceUnit.draw_overlay; it only
+        # changes when the collector moves or turns, so reuse the last one
+        # while it sits still (e.g. mining or unloading).
+        key = (round(self.angle), int(self.pos.x), int(self.pos.y))
+        if key != self._mining_bar_key:
+            surf, _ = self.get_rotated_sprite()
+            rect = self.get_sprite_rect(surf)
+
+            bar_w = self._bar_w
+            bar_h = 6
+            pad = 6
+            bar_x = rect.centerx - bar_w // 2
+            bar_y = rect.top - pad - bar_h
+
+            # Mining bar sits one bar above the health bar
+            mining_y = bar_y - (bar_h + 4)
+            self._mining_bar_key = key
+            self._mining_bar_geom = (bar_x, mining_y, bar_w, bar_h)
+        bar_x, mining_y, bar_w, bar_h = self._mining_bar_geom
 
         bg_rect = pygame.Rect(bar_x, mining_y, bar_w, bar_h)
-        pygame.draw.rect(surface, (40, 40, 40), bg_rect, border_radius=3)
+        fill_w = int(bar_w * self._mining_pct + 0.5)
+        fill_rect = pygame.Rect(bar_x, mining_y, fill_w, bar_h) if fill_w > 0 else None
+        return bg_rect, fill_rect
 
-        fill_w = int(bar_w * pct + 0.5)
-        if fill_w > 0:
-            fill_rect = pygame.Rect(bar_x, mining_y, fill_w, bar_h)
-            pygame.draw.rect(surface, (255, 160, 40), fill_rect, border_radius=3)
+    @classmethod
+    def draw_mining_bars(cls, surface, ships) -> None:
+        """Draw the mining meter of every collector in `ships` that carries ore.
 
-        pygame.draw.rect(surface, (10, 10, 10), bg_rect, 1, border_radius=3)
+        Call after the ships' overlays. Rects are gathered first and each layer
+        (background, fill, border) is then drawn for all collectors in one loop.
+        """
+        bars = [ship._mining_bar_rects() for ship in ships if isinstance(ship, cls) and ship.mining_fill > 0.0]
+        if not bars:
+            return
+        draw_rect = pygame.draw.rect
+        for bg_rect, _ in bars:
+            draw_rect(surface, (40, 40, 40), bg_rect, border_radius=3)
+        for _, fill_rect in bars:
+            if fill_rect is not None:
+                draw_rect(surface, (255, 160, 40), fill_rect, border_radius=3)
+        for bg_rect, _ in bars:
+            draw_rect(surface, (10, 10, 10), bg_rect, 1, border_radius=3)
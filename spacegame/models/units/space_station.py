@@ -3,6 +3,11 @@ from spacegame.models.units.fleet_unit import SpaceUnit
 from spacegame.config import IMAGES_DIR
 
 
+def _noop(*args, **kwargs):
+    """Shared body for the station's disabled combat methods."""
+    pass
+
+
 class SpaceStation(SpaceUnit):
     """A stationary space station that serves as a friendly, non-combatant structure.
     
@@ -15,6 +20,24 @@ class SpaceStation(SpaceUnit):
     - Serves as a healing/resupply point for player fleet
     """
 
+    # Fixed stats and sprite in slots; Sprite/SpaceUnit state stays in __dict__.
+    __slots__ = ('base_surf', 'bullet_damage', 'armor_damage', 'max_health', 'health', 'max_armor', 'armor', '_rect_pos')
+
+    # Scaled sprite shared by every station; built on first construction.
+    _BASE_SURF = None
+
+    @classmethod
+    def _get_base_surf(cls) -> pygame.Surface:
+        """Load and scale the station sprite once; later calls reuse it."""
+        if cls._BASE_SURF is None:
+            sprite = pygame.image.load(IMAGES_DIR + "/Higarran_Station.png").convert_alpha()
+            # Stations should be large and visible
+            cls._BASE_SURF = pygame.transform.smoothscale(
+                sprite,
+                (sprite.get_width() // 3, sprite.get_height() // 3)
+            )
+        return cls._BASE_SURF
+
     def shape_id(self):
         return "space_station"
     
@@ -22,14 +45,8 @@ class SpaceStation(SpaceUnit):
         return 0
 
     def __init__(self, start_pos, **kwargs):
-        # Load station sprite
-        sprite = pygame.image.load(IMAGES_DIR + "/Higarran_Station.png").convert_alpha()
-
-        # Scale the sprite to an appropriate size (stations should be large and visible)
-        scaled_sprite = pygame.transform.smoothscale(
-            sprite,
-            (sprite.get_width() // 3, sprite.get_height() // 3)
-        )
+        # Shared, pre-scaled station sprite
+        scaled_sprite = SpaceStation._get_base_surf()
 
         # Initialize as a non-enemy unit with speed and rotation speed of 0
         super().__init__(
@@ -45,6 +62,8 @@ class SpaceStation(SpaceUnit):
         # Update the image to use the sprite instead of the default yellow rect
         self.image = self.base_surf.copy()
         self.rect = self.image.get_rect(center=(int(self.mover.world_pos.x), int(self.mover.world_pos.y)))
+        # world position the rect was last centered on
+        self._rect_pos = self.mover.world_pos.copy()
 
         # Station stats: unkillable, deals no damage
         self.bullet_damage = 0.0
@@ -56,21 +75,12 @@ class SpaceStation(SpaceUnit):
         self.max_armor = 999999.0
         self.armor = self.max_armor
 
-    def take_damage(self, amount):
-        """Stations cannot take damage."""
-        pass
-
-    def take_armor_damage(self, amount):
-        """Stations cannot take armor damage."""
-        pass
-
-    def heal(self, amount):
-        """Stations do not heal (they are not damaged)."""
-        pass
-
-    def fire(self, projectiles_group, target_pos=None):
-        """Stations cannot fire weapons."""
-        pass
+    # Stations cannot take (armor) damage, do not heal (they are never
+    # damaged) and cannot fire weapons; all share one no-op function.
+    take_damage = _noop
+    take_armor_damage = _noop
+    heal = _noop
+    fire = _noop
 
     def update(self, dt, **kwargs):
         """Update the station (limited functionality since it's stationary).
@@ -80,5 +90,10 @@ class SpaceStation(SpaceUnit):
         - Does not rotate
         - Only updates sprite visuals if needed
         """
-        # Update rect position in case it was set at init
-        self.rect.center = (int(self.mover.world_pos.x), int(self.mover.world_pos.y))
+        # Stations never move, so this is normally a no-op; only re-center the
+        # rect if something repositioned the station since the last sync.
+        world_pos = self.mover.world_pos
+        if world_pos == self._rect_pos:
+            return
+        self._rect_pos = world_pos.copy()
+        self.rect.center = (int(world_pos.x), int(world_pos.y))
@@ -1,5 +1,4 @@
 import sys
-import math
 import pygame
 from spacegame.config import (
     SCREEN_WIDTH,
@@ -14,6 +13,7 @@ from spacegame.config import (
     UI_ICON_BLUE,
     PREVIEWS_DIR
 )
+from spacegame.models.blueprints.blueprint import Blueprint
 from spacegame.models.blueprints.interceptorblueprint import BPInterceptor
 from spacegame.models.blueprints.resourcecollectorblueprint import BPResourceCollector
 from spacegame.models.blueprints.plasmabomberblueprint import BPPlasmaBomber
@@ -459,7 +459,7 @@ def fabrication_bpselect_screen(main_player, player_fleet, selected_fabricator_i
 
                 # amount
                 qty = bp.quantity
-                if qty is None or (isinstance(qty, float) and math.isinf(qty)):
+                if qty is None or qty >= Blueprint.INFINITE:
                     qty_text = "INF"
                 else:
                     qty_text = f"{int(qty):,}"
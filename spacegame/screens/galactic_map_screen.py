@@ -1,5 +1,7 @@
+import math
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import pygame
-from pygame.math import Vector2
 from spacegame.ui.ui import Button, draw_hex
 from spacegame.screens.internal_screen import internal_screen
 from spacegame.config import PREVIEWS_DIR, SCREEN_WIDTH, SCREEN_HEIGHT, UI_ICON_BLUE
@@ -10,31 +12,151 @@ _GALACTIC_MAP_CACHE = {
     'bg_img': None,
     'small_font': None,
     'fleet_btn_font': None,
+    'panel_title_font': None,
+    'panel_subtitle_font': None,
+    'panel_num_font': None,
+    'notif_font': None,
     'hud_icons': {},
     'hud_separator': None,
     'tier_icons': {},
     'map_icons': {},
+    # icons pre-scaled to their on-screen size
+    'tier_icons_18': {},
+    'map_icons_18': {},
+    'fleet_icon_40': None,
+    # notification preview filename -> 32px icon (None if it failed to load)
+    'notif_icons': {},
+    # plain background of the selected-area panel
+    'panel_bg': None,
+    # Titlecase system name -> converted Map_<Name> preview, most recently used last
+    'system_previews': OrderedDict(),
 }
 
+# Zoom moves in whole steps of this factor from the fit-to-screen zoom, so
+# every zoom level maps to an integer step that keys the scaled-background cache.
+ZOOM_STEP = 1.12
+# Scaled backgrounds kept per map session (most recently used last); the
+# pixel budget keeps a few near-max-zoom surfaces from piling up in memory.
+SCALED_BG_CACHE_SIZE = 8
+SCALED_BG_CACHE_PIXELS = 48 * 1024 * 1024
 
-def _load_cached_image(filename: str, use_convert_alpha: bool = True) -> pygame.Surface:
-    """Load and cache an image."""
+# File extensions picked up as system previews by preload_map_images
+PREVIEW_EXTS = ('.png', '.jpg', '.jpeg')
+# System previews are full-size map images; keep only a few converted at once
+SYSTEM_PREVIEW_CACHE_SIZE = 8
+
+# Threads decoding preview files in parallel (image.load releases the GIL)
+PRELOAD_WORKERS = 4
+
+# Blend flag for icons loaded with premultiplied alpha (skips the per-pixel
+# alpha divide of the regular SRCALPHA blit)
+PREMUL_BLIT = pygame.BLEND_PREMULTIPLIED
+
+# Smoothscaled icons keyed by (id(source), size) -> (source, scaled); holding
+# the source keeps its id from being reused while the entry lives
+_SCALED_ICON_CACHE = {}
+
+# Pre-rendered VIEW buttons keyed by (width, height, id(font))
+_VIEW_BTN_CACHE = {}
+
+# Rendered text surfaces keyed by (font, text, color), most recently used last
+_text_cache = OrderedDict()
+TEXT_CACHE_SIZE = 128
+
+
+def _load_cached_image(filename: str, use_convert_alpha: bool = True, premul: bool = False) -> pygame.Surface:
+    """Load and cache an image.
+
+    With `premul`, the alpha channel is premultiplied into the colors; such
+    surfaces must be blitted with `special_flags=PREMUL_BLIT`. Images without
+    any transparent pixels come back opaque instead (see `_icon_blit_flags`).
+    """
     try:
         img = pygame.image.load(filename)
         if use_convert_alpha:
-            return img.convert_alpha()
+            img = img.convert_alpha()
+            if not premul:
+                return img
+            w, h = img.get_size()
+            if pygame.mask.from_surface(img, 254).count() == w * h:
+                # fully opaque: a plain copy blit beats any alpha blend
+                return img.convert()
+            return img.premul_alpha()
         return img.convert()
     except Exception:
         return None
 
 
+def _icon_blit_flags(img) -> int:
+    """Blit flags for an icon from `_load_cached_image(premul=True)`."""
+    return PREMUL_BLIT if img.get_flags() & pygame.SRCALPHA else 0
+
+
+def _load_raw_image(filename: str):
+    """Load and decode an image without converting it (safe off the display thread)."""
+    try:
+        return pygame.image.load(filename)
+    except Exception:
+        return None
+
+
+def render_cached(font, text: str, color) -> pygame.Surface:
+    """Antialiased `font.render(text, True, color)`, reusing recent results."""
+    key = (font, text, color)
+    surf = _text_cache.get(key)
+    if surf is not None:
+        _text_cache.move_to_end(key)
+        return surf
+    surf = font.render(text, True, color)
+    _text_cache[key] = surf
+    if len(_text_cache) > TEXT_CACHE_SIZE:
+        _text_cache.popitem(last=False)
+    return surf
+
+
+def _scaled_icon(img, size):
+    """Return `img` smoothscaled to `size` (int for a square, or (w, h)), memoized.
+
+    None passes through.
+    """
+    if img is None:
+        return None
+    key = (id(img), size)
+    hit = _SCALED_ICON_CACHE.get(key)
+    if hit is not None and hit[0] is img:
+        return hit[1]
+    wh = (size, size) if isinstance(size, int) else size
+    scaled = pygame.transform.smoothscale(img, wh)
+    _SCALED_ICON_CACHE[key] = (img, scaled)
+    return scaled
+
+
+def _blit_background(surface, bg, pos, color=(0, 0, 0)):
+    """Blit `bg` at `pos`, clearing only the strips of `surface` it leaves uncovered."""
+    if bg is None:
+        surface.fill(color)
+        return
+    sw, sh = surface.get_size()
+    bg_rect = bg.get_rect(topleft=pos)
+    covered = bg_rect.clip(surface.get_rect())
+    if covered.size != (sw, sh):
+        if covered.width and covered.height:
+            surface.fill(color, (0, 0, sw, covered.top))
+            surface.fill(color, (0, covered.bottom, sw, sh - covered.bottom))
+            surface.fill(color, (0, covered.top, covered.left, covered.height))
+            surface.fill(color, (covered.right, covered.top, sw - covered.right, covered.height))
+        else:
+            surface.fill(color)
+    surface.blit(bg, bg_rect)
+
+
 def _init_galactic_map_cache():
     """Pre-initialize all cached resources for galactic map."""
     global _GALACTIC_MAP_CACHE
     
     # Load galaxy map background (expensive)
     if _GALACTIC_MAP_CACHE['bg_img'] is None:
-        _GALACTIC_MAP_CACHE['bg_img'] = _load_cached_image(f"{PREVIEWS_DIR}/GalaxyMap.png", use_convert_alpha=True)
+        _GALACTIC_MAP_CACHE['bg_img'] = _load_cached_image(f"{PREVIEWS_DIR}/GalaxyMap.png", use_convert_alpha=False)
         if _GALACTIC_MAP_CACHE['bg_img'] is None:
             # Fallback placeholder
             _GALACTIC_MAP_CACHE['bg_img'] = pygame.Surface((1024, 768))
@@ -46,6 +168,19 @@ def _init_galactic_map_cache():
     
     if _GALACTIC_MAP_CACHE['fleet_btn_font'] is None:
         _GALACTIC_MAP_CACHE['fleet_btn_font'] = pygame.font.SysFont(None, 19)
+
+    # Selected-area panel and notification fonts
+    if _GALACTIC_MAP_CACHE['panel_title_font'] is None:
+        _GALACTIC_MAP_CACHE['panel_title_font'] = pygame.font.SysFont(None, 20, bold=True)
+
+    if _GALACTIC_MAP_CACHE['panel_subtitle_font'] is None:
+        _GALACTIC_MAP_CACHE['panel_subtitle_font'] = pygame.font.SysFont(None, 14)
+
+    if _GALACTIC_MAP_CACHE['panel_num_font'] is None:
+        _GALACTIC_MAP_CACHE['panel_num_font'] = pygame.font.SysFont(None, 18, bold=True)
+
+    if _GALACTIC_MAP_CACHE['notif_font'] is None:
+        _GALACTIC_MAP_CACHE['notif_font'] = pygame.font.Font(None, 20)
     
     # Pre-load HUD icons
     hud_icon_names = ['Map', 'Sys', 'Battle']
@@ -55,55 +190,216 @@ def _init_galactic_map_cache():
             filename = f"HudIcon_{name}_{suffix}.png"
             key = f"{name}_{suffix}"
             if key not in _GALACTIC_MAP_CACHE['hud_icons']:
-                _GALACTIC_MAP_CACHE['hud_icons'][key] = _load_cached_image(f"{PREVIEWS_DIR}/{filename}", use_convert_alpha=True)
+                _GALACTIC_MAP_CACHE['hud_icons'][key] = _load_cached_image(f"{PREVIEWS_DIR}/{filename}", use_convert_alpha=True, premul=True)
     
     # Pre-load separator
     if _GALACTIC_MAP_CACHE['hud_separator'] is None:
-        _GALACTIC_MAP_CACHE['hud_separator'] = _load_cached_image(f"{PREVIEWS_DIR}/HudIcon_Separator.png", use_convert_alpha=True)
+        _GALACTIC_MAP_CACHE['hud_separator'] = _load_cached_image(f"{PREVIEWS_DIR}/HudIcon_Separator.png", use_convert_alpha=True, premul=True)
     
     # Pre-load tier icons
     for tier in range(4):
         tier_key = f"tier{tier}"
         if tier_key not in _GALACTIC_MAP_CACHE['tier_icons']:
             tier_filename = f"UI_icon_tier{tier}.{'jpg' if tier == 0 else 'png'}"
-            _GALACTIC_MAP_CACHE['tier_icons'][tier_key] = _load_cached_image(f"{PREVIEWS_DIR}/{tier_filename}", use_convert_alpha=True)
+            _GALACTIC_MAP_CACHE['tier_icons'][tier_key] = _load_cached_image(f"{PREVIEWS_DIR}/{tier_filename}", use_convert_alpha=True, premul=True)
+        if tier_key not in _GALACTIC_MAP_CACHE['tier_icons_18']:
+            _GALACTIC_MAP_CACHE['tier_icons_18'][tier_key] = _scaled_icon(_GALACTIC_MAP_CACHE['tier_icons'][tier_key], 18)
     
     # Pre-load map icons
     map_icon_types = ['Asteroirds', 'Station']
     for icon_type in map_icon_types:
         map_key = f"map_{icon_type}"
         if map_key not in _GALACTIC_MAP_CACHE['map_icons']:
-            _GALACTIC_MAP_CACHE['map_icons'][map_key] = _load_cached_image(f"{PREVIEWS_DIR}/UI_Map_{icon_type}.png", use_convert_alpha=True)
+            _GALACTIC_MAP_CACHE['map_icons'][map_key] = _load_cached_image(f"{PREVIEWS_DIR}/UI_Map_{icon_type}.png", use_convert_alpha=True, premul=True)
+        if map_key not in _GALACTIC_MAP_CACHE['map_icons_18']:
+            _GALACTIC_MAP_CACHE['map_icons_18'][map_key] = _scaled_icon(_GALACTIC_MAP_CACHE['map_icons'][map_key], 18)
     
     # Pre-load fleet icon
     if _GALACTIC_MAP_CACHE.get('fleet_icon') is None:
-        _GALACTIC_MAP_CACHE['fleet_icon'] = _load_cached_image(f"{PREVIEWS_DIR}/FleetIcon.png", use_convert_alpha=True)
+        _GALACTIC_MAP_CACHE['fleet_icon'] = _load_cached_image(f"{PREVIEWS_DIR}/FleetIcon.png", use_convert_alpha=True, premul=True)
+    if _GALACTIC_MAP_CACHE['fleet_icon_40'] is None:
+        _GALACTIC_MAP_CACHE['fleet_icon_40'] = _scaled_icon(_GALACTIC_MAP_CACHE['fleet_icon'], 40)
+
+
+def _store_system_preview(name: str, img) -> None:
+    """Add a converted preview to the system preview LRU, evicting the oldest."""
+    previews = _GALACTIC_MAP_CACHE['system_previews']
+    previews[name] = img
+    previews.move_to_end(name)
+    while len(previews) > SYSTEM_PREVIEW_CACHE_SIZE:
+        previews.popitem(last=False)
+
+
+def get_system_preview(name):
+    """Return the Map_<Name> preview for system `name`, loading it on first use.
+
+    Returns None if no preview file exists for the system.
+    """
+    key = str(name).title()
+    previews = _GALACTIC_MAP_CACHE['system_previews']
+    img = previews.get(key)
+    if img is not None:
+        previews.move_to_end(key)
+        return img
+    for ext in PREVIEW_EXTS:
+        img = _load_cached_image(f"{PREVIEWS_DIR}/Map_{key}{ext}", use_convert_alpha=True)
+        if img is not None:
+            _store_system_preview(key, img)
+            return img
+    return None
 
 
 def preload_map_images():
-    """Preload galactic background and all Map_<Name>.png previews from PREVIEWS_DIR.
+    """Preload galactic background and Map_<Name>.png previews from PREVIEWS_DIR.
 
-    Stores results in _GALACTIC_MAP_CACHE['system_previews'] keyed by Titlecase name.
+    Warms _GALACTIC_MAP_CACHE['system_previews'] (keyed by Titlecase name) with
+    up to SYSTEM_PREVIEW_CACHE_SIZE previews; others load on demand through
+    get_system_preview.
     """
     _init_galactic_map_cache()
     import os
-    previews = {}
     try:
-        for fn in os.listdir(PREVIEWS_DIR):
-            if fn.startswith('Map_') and fn.lower().endswith(('.png', '.jpg', '.jpeg')):
-                name = fn[len('Map_'):]
-                name = os.path.splitext(name)[0]
+        # scandir yields the file type with the directory read, no stat per entry
+        found = []
+        with os.scandir(PREVIEWS_DIR) as entries:
+            for entry in entries:
+                fn = entry.name
+                if not fn.startswith('Map_') or not fn.lower().endswith(PREVIEW_EXTS):
+                    continue
+                if not entry.is_file():
+                    continue
+                found.append((fn[len('Map_'):fn.rindex('.')], entry.path))
+        found = found[:SYSTEM_PREVIEW_CACHE_SIZE]
+
+        # Decode the files in parallel, then convert them one by one
+        if found:
+            with ThreadPoolExecutor(max_workers=min(PRELOAD_WORKERS, len(found))) as pool:
+                raw = list(pool.map(_load_raw_image, [path for _, path in found]))
+            for (name, _), img in zip(found, raw):
+                if img is None:
+                    continue
                 try:
-                    img = _load_cached_image(f"{PREVIEWS_DIR}/{fn}", use_convert_alpha=True)
-                    if img is not None:
-                        previews[name.title()] = img
+                    _store_system_preview(name.title(), img.convert_alpha())
                 except Exception:
                     pass
     except Exception:
         pass
 
-    _GALACTIC_MAP_CACHE['system_previews'] = previews
-    return previews
+    return _GALACTIC_MAP_CACHE['system_previews']
+
+
+def clear_galactic_map_cache():
+    """Release the large surfaces cached for the galactic map.
+
+    Called when the game scene is left; the background and previews are
+    reloaded by the next `_init_galactic_map_cache` / `preload_map_images`.
+    """
+    _GALACTIC_MAP_CACHE['bg_img'] = None
+    _GALACTIC_MAP_CACHE['system_previews'].clear()
+    _GALACTIC_MAP_CACHE['notif_icons'].clear()
+    _SCALED_ICON_CACHE.clear()
+    _text_cache.clear()
+
+
+def _view_button(btn_w: int, btn_h: int, font) -> pygame.Surface:
+    """Return the opaque VIEW button (fill + centered label), built once per size/font."""
+    key = (btn_w, btn_h, id(font))
+    buf = _VIEW_BTN_CACHE.get(key)
+    if buf is None:
+        buf = pygame.Surface((btn_w, btn_h)).convert()
+        buf.fill((50, 88, 120))
+        vs = font.render("VIEW", True, (170, 210, 240))
+        buf.blit(vs, ((btn_w - vs.get_width())//2, (btn_h - vs.get_height())//2))
+        _VIEW_BTN_CACHE[key] = buf
+    return buf
+
+
+def _render_area_panel(area, panel_width: int, panel_height: int) -> pygame.Surface:
+    """Render the compact details panel (name, faction, counts, icons, VIEW) for `area`."""
+    padding = 12
+
+    # Semi-transparent background so it blends but remains readable; the
+    # plain fill is built once and copied for each panel
+    panel_bg = _GALACTIC_MAP_CACHE['panel_bg']
+    if panel_bg is None or panel_bg.get_size() != (panel_width, panel_height):
+        # convert_alpha() so panel blits to the screen take the matching-format path
+        panel_bg = pygame.Surface((panel_width, panel_height), pygame.SRCALPHA).convert_alpha()
+        panel_bg.fill((18, 26, 38, 220))
+        _GALACTIC_MAP_CACHE['panel_bg'] = panel_bg
+    panel_surf = panel_bg.copy()
+
+    # Fonts
+    title_font = _GALACTIC_MAP_CACHE['panel_title_font']
+    subtitle_font = _GALACTIC_MAP_CACHE['panel_subtitle_font']
+    num_font = _GALACTIC_MAP_CACHE['panel_num_font']
+
+    # Render texts
+    name_s = render_cached(title_font, area['name'], (230, 230, 255))
+    faction_s = render_cached(subtitle_font, area.get('subtitle', ''), (160, 200, 240))
+
+    # Top-right group: visitable count, tier icon, type icon (right-aligned)
+    visit_count = area.get('visitables', 0)
+    visit_s = render_cached(num_font, str(visit_count), (180, 240, 180))
+
+    icon_size = 18
+    type_icon = _GALACTIC_MAP_CACHE['map_icons_18'].get(f"map_{area.get('type','Asteroirds')}")
+    tier_icon = _GALACTIC_MAP_CACHE['tier_icons_18'].get(f"tier{area.get('tier',0)}")
+
+    # Texts go onto the panel in one fblits() call once every position is known;
+    # the borders/fills under them are drawn first
+    text_ops = [
+        (name_s, (padding, padding)),
+        (faction_s, (padding, padding + name_s.get_height() + 2)),
+    ]
+    icon_ops = []
+
+    # compute positions for right-aligned icons/text
+    # Align the group flush to the panel's top-right (no padding to right/top)
+    right_x = panel_width
+    top_y = 0
+
+    # visit count with border rect (flush to right edge)
+    visit_w = visit_s.get_width()
+    visit_border_padding = 6
+    visit_rect_x = right_x - (visit_w + 2 * visit_border_padding)
+    visit_rect = pygame.Rect(visit_rect_x, top_y, visit_w + 2 * visit_border_padding, icon_size)
+    pygame.draw.rect(panel_surf, UI_ICON_BLUE, visit_rect, 2)  # Border only, no fill
+    # blit visit text inside the border, vertically centered
+    text_x = visit_rect_x + visit_border_padding
+    text_y = top_y + (icon_size - visit_s.get_height()) // 2
+    text_ops.append((visit_s, (text_x, text_y)))
+    # move right_x to the left edge of the visit rect for placing other icons
+    right_x = visit_rect_x
+
+    # icons step left by their width plus a 6px gap
+    icon_stride = icon_size + 6
+
+    # tier icon (left of visit count)
+    if tier_icon:
+        icon_ops.append((tier_icon, (right_x - icon_size, top_y), None, _icon_blit_flags(tier_icon)))
+        right_x -= icon_stride
+
+    # type icon (left of tier)
+    if type_icon:
+        icon_ops.append((type_icon, (right_x - icon_size, top_y), None, _icon_blit_flags(type_icon)))
+        right_x -= icon_stride
+
+    # VIEW Button
+    btn_h = 28
+    btn_w = panel_width - padding * 2
+    # VIEW - spans full width
+    view_rect = pygame.Rect(padding, panel_height - padding - btn_h, btn_w, btn_h)
+    panel_surf.blit(_view_button(btn_w, btn_h, subtitle_font), view_rect)
+
+    # fblits is pygame-ce only
+    if hasattr(panel_surf, 'fblits'):
+        panel_surf.fblits(text_ops)
+    else:
+        panel_surf.blits(text_ops, doreturn=False)
+    # icons carry their own blend flag per item
+    panel_surf.blits(icon_ops, doreturn=False)
+
+    return panel_surf
 
 
 def galactic_map_screen(main_player, player_fleet):
@@ -136,49 +432,48 @@ def galactic_map_screen(main_player, player_fleet):
     fleet_btn_font = _GALACTIC_MAP_CACHE['fleet_btn_font']
     fleet_btn = Button((10, 40, 100, 30), "INTERNAL", fleet_btn_font)
 
-    def draw_hex_button(surface, button, font, base_color, hover_color, header_text):
-        rect = button.rect
-        mouse_pos = pygame.mouse.get_pos()
-        color = hover_color if rect.collidepoint(mouse_pos) else base_color
+    # (header_text, color) -> (pre-rendered hex + label surface, screen position)
+    hex_button_cache = {}
 
-        # hex body
-        draw_hex(surface, rect.center, rect.width * 0.9, rect.height * 1.2, color, 3)
+    def render_hex_button(rect, font, color, header_text):
+        cx, cy = rect.center
+        hex_w, hex_h = rect.width * 0.9, rect.height * 1.2
 
         # header text at top-left of the hex
         label = font.render(header_text, True, color)
         label_rect = label.get_rect()
         label_rect.bottomleft = (rect.left, rect.top - 10)
-        surface.blit(label, label_rect)
+
+        # cover the hex outline (plus line thickness) and the label
+        bounds = pygame.Rect(int(cx - hex_w / 2) - 4, int(cy - hex_h / 2) - 4, int(hex_w) + 9, int(hex_h) + 9).union(label_rect)
+        surf = pygame.Surface(bounds.size, pygame.SRCALPHA)
+        draw_hex(surf, (cx - bounds.x, cy - bounds.y), hex_w, hex_h, color, 3)
+        surf.blit(label, label_rect.move(-bounds.x, -bounds.y))
+        return surf, bounds.topleft
+
+    def draw_hex_button(surface, button, font, base_color, hover_color, header_text, mouse_pos):
+        rect = button.rect
+        color = hover_color if rect.collidepoint(mouse_pos) else base_color
+        key = (header_text, color)
+        cached = hex_button_cache.get(key)
+        if cached is None:
+            cached = hex_button_cache[key] = render_hex_button(rect, font, color, header_text)
+        return surface.blit(*cached)
 
     # --- HUD Icons (use cached icons) ---
     hud_icon_names = ['Map', 'Sys', 'Battle']
     hud_selected_index = 0
     selected_area = None  # Track selected map area
 
-    # Pre-scaled HUD icons cache (per session)
-    hud_icon_scaled_cache = {}
+    # HUD icons scaled through the shared icon cache (kept across sessions)
     def get_scaled_icon(name: str, selected: bool):
-        cache_key = f"{name}_{selected}"
-        if cache_key not in hud_icon_scaled_cache:
-            icon_key = f"{name}_{'Selected' if selected else 'Unselected'}"
-            icon = _GALACTIC_MAP_CACHE['hud_icons'].get(icon_key)
-            if icon:
-                scaled = pygame.transform.smoothscale(icon, (80, 80))
-                scaled.set_alpha(255)
-                hud_icon_scaled_cache[cache_key] = scaled
-        return hud_icon_scaled_cache.get(cache_key)
-
-    separator_scaled = None
+        icon_key = f"{name}_{'Selected' if selected else 'Unselected'}"
+        return _scaled_icon(_GALACTIC_MAP_CACHE['hud_icons'].get(icon_key), 80)
+
     def get_scaled_separator():
-        nonlocal separator_scaled
-        if separator_scaled is None:
-            separator = _GALACTIC_MAP_CACHE['hud_separator']
-            if separator:
-                separator_scaled = pygame.transform.smoothscale(separator, (20, 10))
-                separator_scaled.set_alpha(255)
-        return separator_scaled
-
-    # --- Galaxy map background (now cached with convert_alpha) ---
+        return _scaled_icon(_GALACTIC_MAP_CACHE['hud_separator'], (20, 10))
+
+    # --- Galaxy map background (cached, opaque) ---
     bg_img = _GALACTIC_MAP_CACHE['bg_img']
     bg_w, bg_h = bg_img.get_size()
 
@@ -191,21 +486,104 @@ def galactic_map_screen(main_player, player_fleet):
         elif 'pos' not in a:
             a['pos'] = (map_center_x, map_center_y)
 
+    # Case-insensitive name -> area lookup
+    area_by_upper = {a['name'].upper(): a for a in map_areas if a.get('name')}
+    # (area, world x, world y) triples for the per-frame transform
+    area_points = [(a, a['pos'][0], a['pos'][1]) for a in map_areas]
+
+    def visible_area_points(z, ox, oy, margin=50):
+        """Return (area, screen x, screen y) for the areas within `margin` of the screen."""
+        x_min, x_max = -margin, width + margin
+        y_min, y_max = -margin, height + margin
+        out = []
+        for a, wx, wy in area_points:
+            sx = wx * z + ox
+            if x_min < sx < x_max:
+                sy = wy * z + oy
+                if y_min < sy < y_max:
+                    out.append((a, sx, sy))
+        return out
+
+    # View transform - default fully zoomed out so whole map is visible.
+    # The zoom state is the integer `zoom_step`; `zoom` is derived from it.
+    fit_zoom = min(width / bg_w, height / bg_h) if bg_w and bg_h else 1.0
+    zoom_step = 0
+    zoom = fit_zoom
+    
+    # Calculate safe max_zoom to prevent surface size crashes
+    # Limit scaled surface to a reasonable max (e.g., 4096 x 4096 pixels max)
+    MAX_SCALED_DIMENSION = 8192
+    max_zoom = min(4.0, MAX_SCALED_DIMENSION / max(bg_w, bg_h))
+    # highest whole zoom step that stays within max_zoom
+    max_zoom_step = max(0, int(math.floor(math.log(max_zoom / fit_zoom) / math.log(ZOOM_STEP)))) if max_zoom > fit_zoom else 0
+
+    def zoom_for_step(step):
+        return fit_zoom * ZOOM_STEP ** step
+
+    # Scaled backgrounds by zoom step (LRU); scaling is delayed to the first
+    # frame to avoid lag on entry, and zooming back to a recent level is a lookup.
+    scaled_bg_cache = OrderedDict()
+    cached_zoom_step = None
+    cached_bg_scaled = None
+
+    def get_scaled_bg(step):
+        bg = scaled_bg_cache.get(step)
+        if bg is not None:
+            scaled_bg_cache.move_to_end(step)
+            return bg
+        step_zoom = zoom_for_step(step)
+        scaled_size = (max(1, int(bg_w * step_zoom)), max(1, int(bg_h * step_zoom)))
+        # Safety check: ensure scaled size doesn't exceed limits
+        if scaled_size[0] > MAX_SCALED_DIMENSION or scaled_size[1] > MAX_SCALED_DIMENSION:
+            scale_factor = min(MAX_SCALED_DIMENSION / scaled_size[0], MAX_SCALED_DIMENSION / scaled_size[1])
+            scaled_size = (max(1, int(scaled_size[0] * scale_factor)), max(1, int(scaled_size[1] * scale_factor)))
+        try:
+            bg = pygame.transform.smoothscale(bg_img, scaled_size)
+        except Exception:
+            # Fallback to regular scale if smoothscale fails
+            try:
+                bg = pygame.transform.scale(bg_img, scaled_size)
+            except Exception:
+                # If both fail, use the original image
+                bg = bg_img
+        scaled_bg_cache[step] = bg
+        pixels = sum(b.get_width() * b.get_height() for b in scaled_bg_cache.values())
+        while len(scaled_bg_cache) > 1 and (len(scaled_bg_cache) > SCALED_BG_CACHE_SIZE or pixels > SCALED_BG_CACHE_PIXELS):
+            _, old = scaled_bg_cache.popitem(last=False)
+            pixels -= old.get_width() * old.get_height()
+        return bg
+
+    # offset is the top-left of the image in screen coordinates; center image by default
+    offset_x, offset_y = (width - bg_w * zoom) / 2, (height - bg_h * zoom) / 2
+
+    def clamp_offset(ox, oy):
+        """Return (ox, oy) clamped so the map covers the screen at the current zoom."""
+        scaled_w = bg_w * zoom
+        scaled_h = bg_h * zoom
+        # center when smaller than screen
+        if scaled_w <= width:
+            ox = (width - scaled_w) / 2
+        else:
+            ox = max(min(ox, 0), width - scaled_w)
+        if scaled_h <= height:
+            oy = (height - scaled_h) / 2
+        else:
+            oy = max(min(oy, 0), height - scaled_h)
+        return ox, oy
+
+    # Cinematic bars overlay (a CinematicBars) set by the caller for this visit
+    bars = getattr(main_player, '_cinematic_bars', None)
+
     # If a fleet move has been requested (annotated on main_player), animate the fleet icon
     fleet_move = getattr(main_player, '_fleet_move', None)
     if fleet_move:
         try:
             from_name, to_name = fleet_move
-            # find map area entries for both names (try variants)
+            # find map area entries for both names (case-insensitive)
             def find_area_by_name(n):
                 if n is None:
                     return None
-                for a in map_areas:
-                    if a.get('name') and a['name'].lower() == str(n).lower():
-                        return a
-                    if a.get('name') and a['name'].upper() == str(n).upper():
-                        return a
-                return None
+                return area_by_upper.get(str(n).upper())
 
             a_from = find_area_by_name(from_name)
             a_to = find_area_by_name(to_name)
@@ -213,14 +591,16 @@ def galactic_map_screen(main_player, player_fleet):
                 # compute screen coords for both
                 screen_w, screen_h = width, height
                 zoom_local = zoom
-                off = offset
-                from_px = (a_from['pos'][0] * zoom_local + off.x, a_from['pos'][1] * zoom_local + off.y)
-                to_px = (a_to['pos'][0] * zoom_local + off.x, a_to['pos'][1] * zoom_local + off.y)
-                # simple linear animation over 1.2s
+                from_px = (a_from['pos'][0] * zoom_local + offset_x, a_from['pos'][1] * zoom_local + offset_y)
+                to_px = (a_to['pos'][0] * zoom_local + offset_x, a_to['pos'][1] * zoom_local + offset_y)
+                # simple linear animation over 1.2s; the view doesn't change
+                # while it plays, so scale the background once up front
                 anim_dur = 1.2
                 clock_anim = pygame.time.Clock()
                 t = 0.0
-                fleet_icon = _GALACTIC_MAP_CACHE.get('fleet_icon')
+                fleet_icon = _GALACTIC_MAP_CACHE['fleet_icon_40']
+                cached_zoom_step = zoom_step
+                cached_bg_scaled = get_scaled_bg(zoom_step)
                 while t < anim_dur:
                     dt = clock_anim.tick(60) / 1000.0
                     t += dt
@@ -228,31 +608,14 @@ def galactic_map_screen(main_player, player_fleet):
                     ix = from_px[0] + (to_px[0] - from_px[0]) * alpha
                     iy = from_px[1] + (to_px[1] - from_px[1]) * alpha
                     # draw background scaled as usual
-                    if cached_bg_scaled is None or cached_zoom != zoom_local:
-                        try:
-                            cached_bg_scaled = pygame.transform.smoothscale(bg_img, (int(bg_w * zoom_local), int(bg_h * zoom_local)))
-                        except Exception:
-                            cached_bg_scaled = pygame.transform.scale(bg_img, (int(bg_w * zoom_local), int(bg_h * zoom_local)))
-                    screen.blit(cached_bg_scaled, (off.x, off.y))
+                    _blit_background(screen, cached_bg_scaled, (int(offset_x), int(offset_y)))
                     # draw fleet icon
                     if fleet_icon:
-                        try:
-                            icon = pygame.transform.smoothscale(fleet_icon, (40, 40))
-                            icon.set_alpha(255)
-                            screen.blit(icon, (int(ix - 20), int(iy - 20)))
-                        except Exception:
-                            pass
+                        screen.blit(fleet_icon, (int(ix - 20), int(iy - 20)), special_flags=PREMUL_BLIT)
                     # Draw cinematic bars overlay if requested
-                    try:
-                        bars = getattr(main_player, '_cinematic_bars', None)
-                        if bars:
-                            th = int(bars.get('target_h', SCREEN_HEIGHT * 0.12))
-                            top_y = int(bars.get('top_y', 0))
-                            bot_y = int(bars.get('bot_y', SCREEN_HEIGHT - th))
-                            pygame.draw.rect(screen, (0, 0, 0), (0, top_y, SCREEN_WIDTH, th))
-                            pygame.draw.rect(screen, (0, 0, 0), (0, bot_y, SCREEN_WIDTH, th))
-                    except Exception:
-                        pass
+                    if bars is not None:
+                        screen.fill((0, 0, 0), (0, bars.top_y, SCREEN_WIDTH, bars.th))
+                        screen.fill((0, 0, 0), (0, bars.bot_y, SCREEN_WIDTH, bars.th))
                     pygame.display.flip()
 
         except Exception:
@@ -280,44 +643,38 @@ def galactic_map_screen(main_player, player_fleet):
         except Exception:
             pass
 
-    # View transform - default fully zoomed out so whole map is visible
-    fit_zoom = min(width / bg_w, height / bg_h) if bg_w and bg_h else 1.0
-    zoom = fit_zoom
-    
-    # Calculate safe max_zoom to prevent surface size crashes
-    # Limit scaled surface to a reasonable max (e.g., 4096 x 4096 pixels max)
-    MAX_SCALED_DIMENSION = 8192
-    max_zoom = min(4.0, MAX_SCALED_DIMENSION / max(bg_w, bg_h))
-    min_zoom, max_zoom = fit_zoom, max_zoom
-
-    # Cache for scaled background - delay initial scaling to first frame to avoid lag on entry
-    cached_zoom = None
-    cached_bg_scaled = None
-
-    # offset is the top-left of the image in screen coordinates; center image by default
-    offset = Vector2((width - bg_w * zoom) / 2, (height - bg_h * zoom) / 2)
-
-    def clamp_offset():
-        scaled_w = bg_w * zoom
-        scaled_h = bg_h * zoom
-        # center when smaller than screen
-        if scaled_w <= width:
-            offset.x = (width - scaled_w) / 2
-        else:
-            offset.x = max(min(offset.x, 0), width - scaled_w)
-        if scaled_h <= height:
-            offset.y = (height - scaled_h) / 2
-        else:
-            offset.y = max(min(offset.y, 0), height - scaled_h)
-
     panning = False
     pan_last = (0, 0)
 
+    # selected-area details panel, rendered for `panel_area`
+    panel_area = None
+    panel_surf = None
+
+    # The map is static between inputs: repaint only when an event touched the
+    # view state (`dirty`) or the hover/notification state differs from the
+    # last painted frame (`painted_key`)
+    dirty = True
+    painted_key = None
+    # screen rects of the notifications in the last painted frame
+    notif_rects = []
+
+    # Cache entries and draw helpers used every frame, bound once
+    area_title_font = _GALACTIC_MAP_CACHE['small_font']
+    tier_icons_18 = _GALACTIC_MAP_CACHE['tier_icons_18']
+    map_icons_18 = _GALACTIC_MAP_CACHE['map_icons_18']
+    fleet_icon_40 = _GALACTIC_MAP_CACHE['fleet_icon_40']
+    notif_font = _GALACTIC_MAP_CACHE['notif_font']
+    notif_icons = _GALACTIC_MAP_CACHE['notif_icons']
+    draw_circle = pygame.draw.circle
+
     clock = pygame.time.Clock()
 
     while True:
         dt = clock.tick(60) / 1000.0
         for event in pygame.event.get():
+            # plain mouse motion only matters for hover, checked below
+            if event.type != pygame.MOUSEMOTION or panning:
+                dirty = True
             if event.type == pygame.QUIT:
                 return "exit"
             if event.type == pygame.KEYDOWN:
@@ -335,8 +692,8 @@ def galactic_map_screen(main_player, player_fleet):
                 area_clicked = False
                 for area in map_areas:
                     # Convert world coordinates to screen coordinates
-                    area_screen_x = area['pos'][0] * zoom + offset.x
-                    area_screen_y = area['pos'][1] * zoom + offset.y
+                    area_screen_x = area['pos'][0] * zoom + offset_x
+                    area_screen_y = area['pos'][1] * zoom + offset_y
                     area_rect = pygame.Rect(area_screen_x - 15, area_screen_y - 15, 30, 30)
                     if area_rect.collidepoint(event.pos):
                         selected_area = area
@@ -423,138 +780,124 @@ def galactic_map_screen(main_player, player_fleet):
                 dx = mx - pan_last[0]
                 dy = my - pan_last[1]
                 # move offset by delta (consider zoom so dragging moves map logically)
-                offset.x += dx
-                offset.y += dy
                 pan_last = (mx, my)
-                clamp_offset()
+                offset_x, offset_y = clamp_offset(offset_x + dx, offset_y + dy)
             elif event.type == pygame.MOUSEWHEEL:
                 # Zoom centered on mouse position
+                # one zoom step per wheel notch
                 old_zoom = zoom
-                if event.y > 0:
-                    zoom *= 1.12 ** event.y
-                else:
-                    zoom *= 0.9 ** (-event.y)
-                zoom = max(min_zoom, min(max_zoom, zoom))
+                zoom_step = max(0, min(max_zoom_step, zoom_step + event.y))
+                zoom = zoom_for_step(zoom_step)
 
                 mx, my = pygame.mouse.get_pos()
                 # world coordinates under mouse before zoom
-                world_x = (mx - offset.x) / old_zoom
-                world_y = (my - offset.y) / old_zoom
+                world_x = (mx - offset_x) / old_zoom
+                world_y = (my - offset_y) / old_zoom
                 # adjust offset so world point stays at mouse after zoom
-                offset.x = mx - world_x * zoom
-                offset.y = my - world_y * zoom
-                clamp_offset()
+                offset_x, offset_y = clamp_offset(mx - world_x * zoom, my - world_y * zoom)
+
+        inv_mgr = getattr(main_player, 'inventory_manager', None)
+        notif_list = getattr(inv_mgr, 'notifications', []) if inv_mgr is not None else []
+        mouse_pos = pygame.mouse.get_pos()
+        frame_key = (
+            fleet_btn.rect.collidepoint(mouse_pos),
+            id(notif_list), len(notif_list),
+        )
+        if not dirty and frame_key == painted_key:
+            continue
+        # A hover/notification-only change is sent to the display as just the
+        # rects it touched; anything else flips the whole frame
+        partial_update = not dirty and painted_key is not None
+        hover_changed = painted_key is None or frame_key[0] != painted_key[0]
+        notif_changed = painted_key is None or frame_key[1:] != painted_key[1:]
+        dirty = False
+        painted_key = frame_key
+        prev_notif_rects = notif_rects
 
         # --- Draw ---
-        screen.fill((0, 0, 0))
-
-        # Draw scaled background at offset (use cache, only rescale if zoom changed)
-        if zoom != cached_zoom:
-            cached_zoom = zoom
-            scaled_size = (max(1, int(bg_w * zoom)), max(1, int(bg_h * zoom)))
-            # Safety check: ensure scaled size doesn't exceed limits
-            if scaled_size[0] > MAX_SCALED_DIMENSION or scaled_size[1] > MAX_SCALED_DIMENSION:
-                scale_factor = min(MAX_SCALED_DIMENSION / scaled_size[0], MAX_SCALED_DIMENSION / scaled_size[1])
-                scaled_size = (max(1, int(scaled_size[0] * scale_factor)), max(1, int(scaled_size[1] * scale_factor)))
+        # Draw scaled background at offset (per-step cache, only look up if zoom changed);
+        # the background is opaque, so only the screen area it doesn't cover is cleared
+        if zoom_step != cached_zoom_step:
+            cached_zoom_step = zoom_step
+            cached_bg_scaled = get_scaled_bg(zoom_step)
+
+        _blit_background(screen, cached_bg_scaled, (int(offset_x), int(offset_y)))
+
+        # Draw map areas (selectable regions) that are on screen
+        for area, area_screen_x, area_screen_y in visible_area_points(zoom, offset_x, offset_y):
+            # Draw area circle with glow effect
+            is_selected = (selected_area == area)
+            color = (255, 200, 50) if is_selected else (120, 180, 255)
+            glow_color = (255, 220, 100) if is_selected else (150, 200, 255)
+
+            # Glow ring
+            draw_circle(screen, glow_color, (int(area_screen_x), int(area_screen_y)), 20, 2)
+            # Main circle
+            draw_circle(screen, color, (int(area_screen_x), int(area_screen_y)), 12, 2)
+            # Center dot
+            draw_circle(screen, color, (int(area_screen_x), int(area_screen_y)), 4)
+
+            # Draw small overlay at top-right of the map icon: title + tier icon + type icon
             try:
-                cached_bg_scaled = pygame.transform.smoothscale(bg_img, scaled_size)
+                title_font = area_title_font
+                title_surf = render_cached(title_font, area['name'], (220, 230, 255))
+                icon_size = 18
+                padding = 6
+
+                # Icons
+                tier_key = f"tier{area.get('tier',0)}"
+                tier_icon = tier_icons_18.get(tier_key)
+                type_icon = map_icons_18.get(f"map_{area.get('type','Asteroirds')}")
+
+                text_w = title_surf.get_width()
+                icons_w = (icon_size + 4) * (1 if tier_icon else 0) + (icon_size + 4) * (1 if type_icon else 0)
+                box_w = text_w + padding + icons_w + padding
+                box_h = max(title_surf.get_height(), icon_size) + padding * 2
+
+                box_x = int(area_screen_x + 14)
+                box_y = int(area_screen_y - box_h - 8)
+
+                # Transparent background and no border per request; draw title with shadow for readability
+                text_x = box_x + padding
+                text_y = box_y + padding + (box_h - padding*2 - title_surf.get_height())//2
+                # shadow
+                shadow = render_cached(title_font, area['name'], (0, 0, 0))
+                blit_seq = [(shadow, (text_x + 1, text_y + 1)), (title_surf, (text_x, text_y))]
+
+                # Icons to the right of the text
+                icon_x = box_x + box_w - padding - icon_size
+                icon_y = box_y + padding + (box_h - padding*2 - icon_size)//2
+                if type_icon:
+                    blit_seq.append((type_icon, (icon_x, icon_y), None, _icon_blit_flags(type_icon)))
+                    icon_x -= (icon_size + 4)
+                if tier_icon:
+                    blit_seq.append((tier_icon, (icon_x, icon_y), None, _icon_blit_flags(tier_icon)))
+                screen.blits(blit_seq, doreturn=False)
             except Exception:
-                # Fallback to regular scale if smoothscale fails
-                try:
-                    cached_bg_scaled = pygame.transform.scale(bg_img, scaled_size)
-                except Exception:
-                    # If both fail, use the original image
-                    cached_bg_scaled = bg_img
-
-        if cached_bg_scaled:
-            screen.blit(cached_bg_scaled, (int(offset.x), int(offset.y)))
-
-        # Draw map areas (selectable regions)
-        for area in map_areas:
-            # Convert world coordinates to screen coordinates
-            area_screen_x = area['pos'][0] * zoom + offset.x
-            area_screen_y = area['pos'][1] * zoom + offset.y
-            
-            # Only draw if on screen
-            if -50 < area_screen_x < width + 50 and -50 < area_screen_y < height + 50:
-                # Draw area circle with glow effect
-                is_selected = (selected_area == area)
-                color = (255, 200, 50) if is_selected else (120, 180, 255)
-                glow_color = (255, 220, 100) if is_selected else (150, 200, 255)
-                
-                # Glow ring
-                pygame.draw.circle(screen, glow_color, (int(area_screen_x), int(area_screen_y)), 20, 2)
-                # Main circle
-                pygame.draw.circle(screen, color, (int(area_screen_x), int(area_screen_y)), 12, 2)
-                # Center dot
-                pygame.draw.circle(screen, color, (int(area_screen_x), int(area_screen_y)), 4)
-                
-                # Draw small overlay at top-right of the map icon: title + tier icon + type icon
-                try:
-                    title_font = _GALACTIC_MAP_CACHE['small_font']
-                    title_surf = title_font.render(area['name'], True, (220, 230, 255))
-                    icon_size = 18
-                    padding = 6
-
-                    # Icons
-                    tier_key = f"tier{area.get('tier',0)}"
-                    tier_icon = _GALACTIC_MAP_CACHE['tier_icons'].get(tier_key)
-                    type_icon = _GALACTIC_MAP_CACHE['map_icons'].get(f"map_{area.get('type','Asteroirds')}")
-
-                    text_w = title_surf.get_width()
-                    icons_w = (icon_size + 4) * (1 if tier_icon else 0) + (icon_size + 4) * (1 if type_icon else 0)
-                    box_w = text_w + padding + icons_w + padding
-                    box_h = max(title_surf.get_height(), icon_size) + padding * 2
-
-                    box_x = int(area_screen_x + 14)
-                    box_y = int(area_screen_y - box_h - 8)
-
-                    # Transparent background and no border per request; draw title with shadow for readability
-                    text_x = box_x + padding
-                    text_y = box_y + padding + (box_h - padding*2 - title_surf.get_height())//2
-                    # shadow
-                    shadow = _GALACTIC_MAP_CACHE['small_font'].render(area['name'], True, (0, 0, 0))
-                    screen.blit(shadow, (text_x + 1, text_y + 1))
-                    screen.blit(title_surf, (text_x, text_y))
-
-                    # Blit icons to the right of the text
-                    icon_x = box_x + box_w - padding - icon_size
-                    icon_y = box_y + padding + (box_h - padding*2 - icon_size)//2
-                    if type_icon:
-                        t_scaled = pygame.transform.smoothscale(type_icon, (icon_size, icon_size))
-                        screen.blit(t_scaled, (icon_x, icon_y))
-                        icon_x -= (icon_size + 4)
-                    if tier_icon:
-                        r_scaled = pygame.transform.smoothscale(tier_icon, (icon_size, icon_size))
-                        screen.blit(r_scaled, (icon_x, icon_y))
-                except Exception:
-                    pass
+                pass
 
         # Draw fleet icon at current location
         try:
             current_location = getattr(main_player, 'location_system', None)
-            fleet_icon = _GALACTIC_MAP_CACHE.get('fleet_icon')
+            fleet_icon = fleet_icon_40
             if current_location and fleet_icon:
                 # Find the area matching current location
-                for area in map_areas:
-                    if area['name'].upper() == str(current_location).upper():
-                        fleet_screen_x = area['pos'][0] * zoom + offset.x
-                        fleet_screen_y = area['pos'][1] * zoom + offset.y
-                        
-                        # Only draw if on screen
-                        if -50 < fleet_screen_x < width + 50 and -50 < fleet_screen_y < height + 50:
-                            fleet_icon_scaled = pygame.transform.smoothscale(fleet_icon, (40, 40))
-                            fleet_icon_rect = fleet_icon_scaled.get_rect(center=(int(fleet_screen_x), int(fleet_screen_y)))
-                            screen.blit(fleet_icon_scaled, fleet_icon_rect)
-                        break
+                area = area_by_upper.get(str(current_location).upper())
+                if area is not None:
+                    fleet_screen_x = area['pos'][0] * zoom + offset_x
+                    fleet_screen_y = area['pos'][1] * zoom + offset_y
+
+                    # Only draw if on screen
+                    if -50 < fleet_screen_x < width + 50 and -50 < fleet_screen_y < height + 50:
+                        fleet_icon_rect = fleet_icon.get_rect(center=(int(fleet_screen_x), int(fleet_screen_y)))
+                        screen.blit(fleet_icon, fleet_icon_rect, special_flags=PREMUL_BLIT)
         except Exception:
             pass
         # Top-left: fleet button (hex style to match game_screen)
-        draw_hex_button(screen, fleet_btn, fleet_btn_font, base_color=(120, 200, 255), hover_color=(190, 230, 255), header_text="INTERNAL")
+        fleet_btn_area = draw_hex_button(screen, fleet_btn, fleet_btn_font, base_color=(120, 200, 255), hover_color=(190, 230, 255), header_text="INTERNAL", mouse_pos=mouse_pos)
 
         # Notifications: replicate basic placement and drawing from game_screen
-        inv_mgr = getattr(main_player, 'inventory_manager', None)
-        notif_list = getattr(inv_mgr, 'notifications', []) if inv_mgr is not None else []
+        notif_rects = []
         if notif_list:
             popup_w = 320
             popup_h = 40
@@ -562,7 +905,8 @@ def galactic_map_screen(main_player, player_fleet):
             icon_size = 32
             base_x = fleet_btn.rect.left
             base_y = fleet_btn.rect.bottom + 8
-            small_font = pygame.font.Font(None, 20)
+            small_font = notif_font
+            blit_seq = []
             for idx, n in enumerate(notif_list):
                 nx = base_x
                 ny = base_y + idx * (popup_h + 6)
@@ -570,13 +914,16 @@ def galactic_map_screen(main_player, player_fleet):
 
                 preview_fn = n.get('preview')
                 try:
+                    icon_s = None
                     if preview_fn:
-                        icon = pygame.image.load(PREVIEWS_DIR + "/" + preview_fn).convert_alpha()
-                    else:
-                        icon = None
-                    if icon is not None:
-                        icon_s = pygame.transform.smoothscale(icon, (icon_size, icon_size))
-                        screen.blit(icon_s, (nx + padding, ny + (popup_h - icon_size) // 2))
+                        if preview_fn in notif_icons:
+                            icon_s = notif_icons[preview_fn]
+                        else:
+                            # load and scale once per preview file
+                            icon_s = _scaled_icon(_load_cached_image(PREVIEWS_DIR + "/" + preview_fn, premul=True), icon_size)
+                            notif_icons[preview_fn] = icon_s
+                    if icon_s is not None:
+                        blit_seq.append((icon_s, (nx + padding, ny + (popup_h - icon_size) // 2), None, PREMUL_BLIT))
                 except Exception:
                     pass
 
@@ -584,10 +931,11 @@ def galactic_map_screen(main_player, player_fleet):
                 text = n.get('text', title)
                 tx = nx + padding + (icon_size + 8 if preview_fn else 0)
                 # shadow
-                shadow_surf = small_font.render(text, True, (0, 0, 0))
-                screen.blit(shadow_surf, (tx + 1, ny + (popup_h - small_font.get_height()) // 2 + 1))
-                text_surf = small_font.render(text, True, (108, 198, 219))
-                screen.blit(text_surf, (tx, ny + (popup_h - small_font.get_height()) // 2))
+                shadow_surf = render_cached(small_font, text, (0, 0, 0))
+                blit_seq.append((shadow_surf, (tx + 1, ny + (popup_h - small_font.get_height()) // 2 + 1)))
+                text_surf = render_cached(small_font, text, (108, 198, 219))
+                blit_seq.append((text_surf, (tx, ny + (popup_h - small_font.get_height()) // 2)))
+            notif_rects = screen.blits(blit_seq)
 
         # Top-right HUD icons (use lazy-scaled cache)
         hud_icon_y = 20
@@ -599,13 +947,13 @@ def galactic_map_screen(main_player, player_fleet):
                 sep = get_scaled_separator()
                 if sep:
                     sep_rect = sep.get_rect(center=(x + 70, hud_icon_y + 40))
-                    screen.blit(sep, sep_rect)
+                    screen.blit(sep, sep_rect, special_flags=PREMUL_BLIT)
 
             is_selected = (i == hud_selected_index)
             icon_scaled = get_scaled_icon(name, is_selected)
             if icon_scaled:
                 icon_rect = icon_scaled.get_rect(topleft=(x - 40, hud_icon_y))
-                screen.blit(icon_scaled, icon_rect)
+                screen.blit(icon_scaled, icon_rect, special_flags=PREMUL_BLIT)
 
         # Draw simplified compact details rect on the right side if an area is selected
         if selected_area:
@@ -614,84 +962,26 @@ def galactic_map_screen(main_player, player_fleet):
             panel_x = width - panel_width - 18
             panel_y = 120
 
-            padding = 12
-
-            # Create semi-transparent surface so it blends but remains readable
-            panel_surf = pygame.Surface((panel_width, panel_height), pygame.SRCALPHA)
-            panel_surf.fill((18, 26, 38, 220))
-
-            # Fonts
-            title_font = pygame.font.SysFont(None, 20, bold=True)
-            subtitle_font = pygame.font.SysFont(None, 14)
-            num_font = pygame.font.SysFont(None, 18, bold=True)
-
-            # Render texts
-            name_s = title_font.render(selected_area['name'], True, (230, 230, 255))
-            faction_s = subtitle_font.render(selected_area.get('subtitle', ''), True, (160, 200, 240))
-
-            # Top-right group: visitable count, tier icon, type icon (right-aligned)
-            visit_count = selected_area.get('visitables', 0)
-            visit_s = num_font.render(str(visit_count), True, (180, 240, 180))
-
-            icon_size = 18
-            type_icon = _GALACTIC_MAP_CACHE['map_icons'].get(f"map_{selected_area.get('type','Asteroirds')}")
-            tier_icon = _GALACTIC_MAP_CACHE['tier_icons'].get(f"tier{selected_area.get('tier',0)}")
-
-            # Blit onto panel surface
-            panel_surf.blit(name_s, (padding, padding))
-            panel_surf.blit(faction_s, (padding, padding + name_s.get_height() + 2))
-
-            # compute positions for right-aligned icons/text
-            # Align the group flush to the panel's top-right (no padding to right/top)
-            right_x = panel_width
-            top_y = 0
-
-            # visit count with border rect (flush to right edge)
-            visit_w = visit_s.get_width()
-            visit_border_padding = 6
-            visit_rect_x = right_x - (visit_w + 2 * visit_border_padding)
-            visit_rect = pygame.Rect(visit_rect_x, top_y, visit_w + 2 * visit_border_padding, icon_size)
-            pygame.draw.rect(panel_surf, UI_ICON_BLUE, visit_rect, 2)  # Border only, no fill
-            # blit visit text inside the border, vertically centered
-            text_x = visit_rect_x + visit_border_padding
-            text_y = top_y + (icon_size - visit_s.get_height()) // 2
-            panel_surf.blit(visit_s, (text_x, text_y))
-            # move right_x to the left edge of the visit rect for placing other icons
-            right_x = visit_rect_x
-
-            # tier icon (left of visit count)
-            if tier_icon:
-                t_scaled = pygame.transform.smoothscale(tier_icon, (icon_size, icon_size))
-                panel_surf.blit(t_scaled, (right_x - icon_size, top_y))
-                right_x -= (icon_size + 6)
-
-            # type icon (left of tier)
-            if type_icon:
-                m_scaled = pygame.transform.smoothscale(type_icon, (icon_size, icon_size))
-                panel_surf.blit(m_scaled, (right_x - icon_size, top_y))
-                right_x -= (icon_size + 6)
-
-            # VIEW Button
-            btn_h = 28
-            btn_w = panel_width - padding * 2
-            # VIEW - spans full width
-            view_rect = pygame.Rect(padding, panel_height - padding - btn_h, btn_w, btn_h)
-            pygame.draw.rect(panel_surf, (50, 88, 120), view_rect)
-            vs = subtitle_font.render("VIEW", True, (170, 210, 240))
-            panel_surf.blit(vs, (view_rect.x + (btn_w - vs.get_width())//2, view_rect.y + (btn_h - vs.get_height())//2))
+            # Panel content only depends on the area; re-render on selection change
+            if panel_area is not selected_area:
+                panel_surf = _render_area_panel(selected_area, panel_width, panel_height)
+                panel_area = selected_area
 
             # Blit panel surface to screen
             screen.blit(panel_surf, (panel_x, panel_y))
 
         # If cinematic bars overlay requested by caller, draw them on top
-        try:
-            bars = getattr(main_player, '_cinematic_bars', None)
-            if bars:
-                th = int(bars.get('target_h', SCREEN_HEIGHT * 0.12))
-                top_y = int(bars.get('top_y', -th))
-                bot_y = int(bars.get('bot_y', SCREEN_HEIGHT))
-                pygame.draw.rect(screen, (0, 0, 0), (0, top_y, SCREEN_WIDTH, th))
-                pygame.draw.rect(screen, (0, 0, 0), (0, bot_y, SCREEN_WIDTH, th))
-        except Exception:
-            pass
-        pygame.display.flip()
+        if bars is not None:
+            screen.fill((0, 0, 0), (0, bars.top_y, SCREEN_WIDTH, bars.th))
+            screen.fill((0, 0, 0), (0, bars.bot_y, SCREEN_WIDTH, bars.th))
+
+        if partial_update:
+            update_rects = [fleet_btn_area] if hover_changed else []
+            if notif_changed:
+                update_rects += prev_notif_rects + notif_rects
+            if sum(rect.width * rect.height for rect in update_rects) < width * height:
+                pygame.display.update(update_rects)
+            else:
+                pygame.display.flip()
+        else:
+            pygame.display.flip()
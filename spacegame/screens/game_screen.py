@@ -16,10 +16,11 @@ from spacegame.models.asteroids.asteroidc import MineableAsteroidC
 from spacegame.models.asteroids.asteroidm import MineableAsteroidM
 from spacegame.core.mover import Mover
 from spacegame.core import effects
+from spacegame.core.projectile import ProjectileGroup
 from spacegame.core.utils import spawn_enemy_wave, handle_auto_fire, handle_projectile_collisions
 from spacegame.core import events
 from spacegame.ui.hud_ui import HudUI
-from spacegame.ui.ui import Button, draw_triangle, draw_diamond, draw_dalton, draw_hex, OREM_PREVIEW_IMG
+from spacegame.ui.ui import Button, CinematicBars, draw_triangle, draw_diamond, draw_dalton, draw_hex, OREM_PREVIEW_IMG
 from spacegame.core.fabrication import get_fabrication_manager
 from spacegame.core.sound_manager import get_sound_manager
 from spacegame.config import (
@@ -344,12 +345,7 @@ def play_jump_cinematic(main_player, player_fleet, prev_system, new_system, prev
     try:
         # Annotate main_player so map screens draw the cinematic bars overlay
         try:
-            setattr(main_player, '_cinematic_bars', {
-                'target_h': int(target_h),
-                'top_y': 0,
-                'bot_y': SCREEN_HEIGHT - int(target_h),
-                'close_speed': close_speed,
-            })
+            main_player._cinematic_bars = CinematicBars(int(target_h), 0, SCREEN_HEIGHT - int(target_h), close_speed)
         except Exception:
             pass
         if prev_system and new_system and prev_system != new_system:
@@ -426,9 +422,10 @@ def run_game():
         main_player.location_system = 'Lazarus'
         main_player.location_area = 'Lazarus Station'
 
+    main_player.frigate = Frigate((500, 400))
     player_fleet = [
         main_player,
-        Frigate((500, 400))
+        main_player.frigate
         ]
 
     # Sprite groups for bulk updates/draws
@@ -439,7 +436,7 @@ def run_game():
             player_group.add(s)
 
     # Single projectile group for all projectiles
-    projectile_group = pygame.sprite.Group()
+    projectile_group = ProjectileGroup()
 
     # Load location data and spawn appropriate asteroids/enemies based on location type
     location_data = get_location_data(main_player)
@@ -553,10 +550,10 @@ def run_game():
                 bars = None
 
             # If cinematic provided bars data, animate them opening while drawing gameplay
-            if bars:
+            if bars is not None:
                 try:
-                    th = int(bars.get('target_h') or max(24, int(SCREEN_HEIGHT * 0.12)))
-                    speed = float(bars.get('close_speed') or 160.0)
+                    th = bars.th or max(24, int(SCREEN_HEIGHT * 0.12))
+                    speed = bars.close_speed or 160.0
                     tdur = th / speed if speed > 0 else 0.0
                     open_clock = pygame.time.Clock()
                     open_elapsed = 0.0
@@ -856,22 +853,25 @@ def run_game():
             pass
 
         # --- Update healing and mining for resource collectors ---
-        for collector in [s for s in player_fleet if isinstance(s, ResourceCollector)]:
-            collector.update_healing(dt)
-            collector.update_mining(dt)
+        ResourceCollector.update_all(player_fleet, dt)
 
         # --- Update movement ---
         for spaceship in player_fleet:
             spaceship.mover.update(dt)
         # --- Handle recalled fighters: fly back to main ship and re-dock ---
         recalled_done = []
+        home = main_player.pos
+        home_x, home_y = home.x, home.y
         for spaceship in player_fleet:
             if isinstance(spaceship, (Interceptor, ResourceCollector, PlasmaBomber)) and getattr(spaceship, "recalling", False):
                 # Always steer toward the main ship
-                spaceship.mover.set_target(main_player.pos)
+                spaceship.mover.set_target(home)
 
-                # When close enough, mark for docking
-                if (spaceship.pos - main_player.pos).length() < 50:
+                # When close enough (squared, no Vector2 temporary), mark for docking
+                sp = spaceship.pos
+                dx = sp.x - home_x
+                dy = sp.y - home_y
+                if dx * dx + dy * dy < 2500:
                     recalled_done.append(spaceship)
 
         for craft in recalled_done:
@@ -906,7 +906,7 @@ def run_game():
                 if dist > e.fire_range * 0.95:
                     e.mover.set_target(closest.pos)  # approach
                 else:
-                    e.mover.set_target(e.pos)  # hold & shoot
+                    e.mover.stop()  # hold & shoot
             e.mover.update(dt)
 
         # Sync sprite images/rects to mover state
@@ -974,6 +974,8 @@ def run_game():
 
         enemy_fleet = [s for s in enemy_fleet if s.health > 0.0]
         player_fleet = [s for s in player_fleet if s.health > 0.0]
+        if main_player.frigate is not None and main_player.frigate.health <= 0.0:
+            main_player.frigate = None
 
         # remove sprites for any ships that were filtered out
         for e in prev_enemies:
@@ -1069,6 +1071,9 @@ def run_game():
                         2
                     )
 
+        # orange mining meters above carrying collectors, batched per layer
+        ResourceCollector.draw_mining_bars(screen, player_fleet)
+
 
         # static outlined hex over the ExpeditionShip (does not rotate)
         moth_center = (main_player.pos.x, main_player.pos.y)
@@ -22,7 +22,10 @@ def star_system_map(main_player, player_fleet, system_name: str | None = None):
     Controls:
     - ESC: go back
     """
-    pygame.init()
+    # only what this screen needs; a full pygame.init() would also reopen the
+    # audio device that SoundManager opens on demand
+    pygame.display.init()
+    pygame.font.init()
     screen = pygame.display.get_surface()
     if screen is None:
         screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
@@ -36,12 +39,11 @@ def star_system_map(main_player, player_fleet, system_name: str | None = None):
     if not name:
         name = 'None'
 
-    # Try to use preloaded system preview if available (cached by galactic_map_screen.preload_map_images)
+    # Use the galactic map's system preview cache (preloaded or loaded on demand)
     bg_img = None
     try:
-        from spacegame.screens.galactic_map_screen import _GALACTIC_MAP_CACHE as _GMC
-        sys_previews = _GMC.get('system_previews', {})
-        bg_img = sys_previews.get(str(name).title()) if sys_previews else None
+        from spacegame.screens.galactic_map_screen import get_system_preview
+        bg_img = get_system_preview(name)
     except Exception:
         bg_img = None
 
@@ -300,16 +302,10 @@ def star_system_map(main_player, player_fleet, system_name: str | None = None):
                         except Exception:
                             pass
                     # Draw cinematic bars overlay if requested
-                    try:
-                        bars = getattr(main_player, '_cinematic_bars', None)
-                        if bars:
-                            th = int(bars.get('target_h', SCREEN_HEIGHT * 0.12))
-                            top_y = int(bars.get('top_y', 0))
-                            bot_y = int(bars.get('bot_y', SCREEN_HEIGHT - th))
-                            pygame.draw.rect(screen, (0, 0, 0), (0, top_y, SCREEN_WIDTH, th))
-                            pygame.draw.rect(screen, (0, 0, 0), (0, bot_y, SCREEN_WIDTH, th))
-                    except Exception:
-                        pass
+                    bars = getattr(main_player, '_cinematic_bars', None)
+                    if bars is not None:
+                        pygame.draw.rect(screen, (0, 0, 0), (0, bars.top_y, SCREEN_WIDTH, bars.th))
+                        pygame.draw.rect(screen, (0, 0, 0), (0, bars.bot_y, SCREEN_WIDTH, bars.th))
                     pygame.display.flip()
 
                 # clear annotation
@@ -711,14 +707,8 @@ def star_system_map(main_player, player_fleet, system_name: str | None = None):
             clamp_offset()
 
         # If cinematic bars overlay requested by caller, draw them on top
-        try:
-            bars = getattr(main_player, '_cinematic_bars', None)
-            if bars:
-                th = int(bars.get('target_h', SCREEN_HEIGHT * 0.12))
-                top_y = int(bars.get('top_y', -th))
-                bot_y = int(bars.get('bot_y', SCREEN_HEIGHT))
-                pygame.draw.rect(screen, (0, 0, 0), (0, top_y, SCREEN_WIDTH, th))
-                pygame.draw.rect(screen, (0, 0, 0), (0, bot_y, SCREEN_WIDTH, th))
-        except Exception:
-            pass
+        bars = getattr(main_player, '_cinematic_bars', None)
+        if bars is not None:
+            pygame.draw.rect(screen, (0, 0, 0), (0, bars.top_y, SCREEN_WIDTH, bars.th))
+            pygame.draw.rect(screen, (0, 0, 0), (0, bars.bot_y, SCREEN_WIDTH, bars.th))
         pygame.display.flip()
\ No newline at end of file
@@ -5,9 +5,8 @@ and provides input handling for small deploy/recall buttons.
 """
 
 import pygame
-from spacegame.models.units.frigate import Frigate
 from spacegame.ui.ui import preview_for_unit, draw_triangle, draw_diamond, draw_dalton, draw_hex, draw_health_bar, draw_armor_bar
-from spacegame.config import UI_TAB_TEXT_SELECTED
+from spacegame.config import SCREEN_WIDTH, UI_TAB_TEXT_SELECTED
 from spacegame.core.sound_manager import get_sound_manager
 
 
@@ -23,17 +22,6 @@ class HudUI:
         self.font = font
         self.preview_size = preview_size
 
-        # pre-scaled light craft preview sprites for hangar icons
-        self.interceptor_preview_img = pygame.transform.smoothscale(
-            preview_for_unit("interceptor"), (preview_size, preview_size)
-        )
-        self.resource_collector_preview_img = pygame.transform.smoothscale(
-            preview_for_unit("resource_collector"), (preview_size, preview_size)
-        )
-        self.bomber_preview_img = pygame.transform.smoothscale(
-            preview_for_unit("plasma_bomber"), (preview_size, preview_size)
-        )
-
         # --- Unified preview row layout ---
         row_y = 630
 
@@ -53,14 +41,142 @@ class HudUI:
 
         # --- 3 interceptor previews, evenly spaced to the right of the ExpeditionShip ---
         self.hangar_slots = [
-            {'preview_position': pygame.Vector2(280, row_y), 'show_button': False, 'button_rect': pygame.Rect(0, 0, 80, 25)},
-            {'preview_position': pygame.Vector2(380, row_y), 'show_button': False, 'button_rect': pygame.Rect(0, 0, 80, 25)},
-            {'preview_position': pygame.Vector2(480, row_y), 'show_button': False, 'button_rect': pygame.Rect(0, 0, 80, 25)},
+            {'preview_position': pygame.Vector2(280, row_y), 'show_button': False},
+            {'preview_position': pygame.Vector2(380, row_y), 'show_button': False},
+            {'preview_position': pygame.Vector2(480, row_y), 'show_button': False},
         ]
 
+        # Hit-test rects never move after layout, so build them once here
+        # instead of on every click/frame.
+        ms_center = self.expeditionship_preview['preview_position']
+        ms_w = self.expeditionship_preview['width']
+        ms_h = self.expeditionship_preview['height']
+        self.expeditionship_preview['rect'] = pygame.Rect(
+            int(ms_center.x - ms_w / 2), int(ms_center.y - ms_h / 2), int(ms_w), int(ms_h)
+        )
+        fr_center = self.frigate_preview['preview_position']
+        fr_w = self.frigate_preview['width'] * 2
+        fr_h = self.frigate_preview['height'] * 2
+        self.frigate_preview['rect'] = pygame.Rect(
+            int(fr_center.x - fr_w / 2), int(fr_center.y - fr_h / 2), int(fr_w), int(fr_h)
+        )
+        for hangar_slot in self.hangar_slots:
+            pos = hangar_slot['preview_position']
+            hangar_slot['preview_rect'] = pygame.Rect(
+                pos.x - preview_size // 2,
+                pos.y - preview_size // 2,
+                preview_size, preview_size,
+            )
+            # deploy/recall button sits above the preview; only its visibility toggles
+            hangar_slot['button_rect'] = pygame.Rect(pos.x - 40, pos.y - 65, 80, 25)
+        # Slot preview rects in slot order, for a single collidelist() hit test
+        self._slot_preview_rects = [slot['preview_rect'] for slot in self.hangar_slots]
+
+        # Pre-rendered preview sprites and overlay shapes keyed by their
+        # parameters; only a handful of combinations ever appear.
+        self._surf_cache = {}
+        # Rendered health/armor bars keyed by size and filled width, so a
+        # bar only gets redrawn when its on-screen fill actually changes.
+        self._bar_cache = {}
+
+        # The whole HUD strip is cached on a layer the size of the band it
+        # occupies; it is re-rendered when the state key from `_state_key`
+        # changes.
+        self._ui_rect = pygame.Rect(0, row_y - 75, SCREEN_WIDTH, 150)
+        self._ui_surf = pygame.Surface(self._ui_rect.size, pygame.SRCALPHA)
+        self._last_state = None
+
+        # Layout positions shifted into the strip layer's coordinates, used
+        # by `_render`; the screen-space ones above stay for hit tests.
+        ui_offset = pygame.Vector2(0, self._ui_rect.top)
+        for preview in (self.expeditionship_preview, self.frigate_preview):
+            preview['ui_position'] = preview['preview_position'] - ui_offset
+        for hangar_slot in self.hangar_slots:
+            hangar_slot['ui_position'] = hangar_slot['preview_position'] - ui_offset
+            hangar_slot['ui_button_rect'] = hangar_slot['button_rect'].move(0, -self._ui_rect.top)
+
+    def _get_preview_surf(self, unit_type, w, h, dimmed=False):
+        """Return the scaled (optionally darkened) preview for `unit_type`, cached."""
+        key = ('preview', unit_type, int(w), int(h), dimmed)
+        surf = self._surf_cache.get(key)
+        if surf is None:
+            surf = pygame.transform.smoothscale(preview_for_unit(unit_type), (int(w), int(h)))
+            if dimmed:
+                # darken the ship sprite itself (no dark box)
+                dim = pygame.Surface(surf.get_size(), pygame.SRCALPHA)
+                dim.fill((128, 128, 128, 255))  # < 255 => darker
+                surf.blit(dim, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+            self._surf_cache[key] = surf
+        return surf
+
+    def _get_shape_surf(self, draw_fn, w, h, color, thickness):
+        """Return an SRCALPHA surface with `draw_fn`'s outline centered on it, cached.
+
+        `draw_fn` is one of the `spacegame.ui.ui` shape helpers; triangles
+        only use `w` as their size.
+        """
+        key = ('shape', draw_fn, w, h, color, thickness)
+        surf = self._surf_cache.get(key)
+        if surf is None:
+            side = int(max(w, h) * 1.5) + thickness * 2 + 2
+            surf = pygame.Surface((side, side), pygame.SRCALPHA)
+            center = (side // 2, side // 2)
+            if draw_fn is draw_triangle:
+                draw_fn(surf, center, w, color, thickness)
+            else:
+                draw_fn(surf, center, w, h, color, thickness)
+            self._surf_cache[key] = surf
+        return surf
+
+    def _blit_shape(self, screen, draw_fn, center, w, h, color, thickness):
+        surf = self._get_shape_surf(draw_fn, w, h, color, thickness)
+        half = surf.get_width() // 2
+        screen.blit(surf, (int(center[0]) - half, int(center[1]) - half))
+
+    def _get_bar(self, draw_fn, w, h, value, max_value):
+        """Return (surface, size) for a health/armor bar drawn by `draw_fn`, cached.
+
+        The key mirrors what `draw_health_bar`/`draw_armor_bar` actually
+        render: the bar size, the filled width and the low-health colour.
+        Returns (None, None) when the bar would not be drawn at all.
+        """
+        if max_value <= 0:
+            return None, None
+        pct = max(0.0, min(1.0, float(value) / float(max_value)))
+        key = (draw_fn, w, h, int(w * pct + 0.5), pct >= 0.5)
+        surf = self._bar_cache.get(key)
+        if surf is None:
+            size = pygame.Rect(0, 0, w, h).size
+            surf = pygame.Surface(size, pygame.SRCALPHA)
+            draw_fn(surf, 0, 0, w, h, value, max_value)
+            self._bar_cache[key] = surf
+        return surf, surf.get_size()
+
+    def _queue_bars(self, bars, ship, x, y, w, h):
+        """Append `ship`'s health bar (and armor bar, if any) blits to `bars`."""
+        surf, size = self._get_bar(draw_health_bar, w, h, ship.health, ship.max_health)
+        if surf is not None:
+            bars.append((surf, pygame.Rect((x, y), size)))
+        # Armor bar directly under health, if the ship has armor
+        max_armor = getattr(ship, 'max_armor', 0)
+        if max_armor > 0:
+            surf, size = self._get_bar(draw_armor_bar, w, h, getattr(ship, 'armor', 0), max_armor)
+            bars.append((surf, pygame.Rect((x, y + h + 2), size)))
+
+    @staticmethod
+    def _is_fighter_alive(fighter_ship, alive_ids):
+        """Return True if `fighter_ship` is deployed (its id is in `alive_ids`) and has hull left."""
+        return (
+            fighter_ship is not None and
+            id(fighter_ship) in alive_ids and
+            fighter_ship.health > 0.0
+        )
+
     def handle_mouse_button_down(self, mouse_pos, main_player, player_shapes):
         """Process a left mouse button click. Returns True if the click was consumed by the hangar UI."""
         clicked_ui = False
+        # O(1) membership tests for the per-slot checks below
+        alive_ids = {id(s) for s in player_shapes}
 
         # InventoryManager-backed hangar is required
         inv = getattr(main_player, 'inventory_manager', None)
@@ -83,7 +199,7 @@ class HudUI:
                     # RECALL: check deployed ships tracked by hangar
                     icpts = getattr(hangar, 'ships', [None, None, None])
                     fighter_ship = icpts[i] if i < len(icpts) else None
-                    if fighter_ship is not None and fighter_ship in player_shapes and fighter_ship.health > 0.0:
+                    if self._is_fighter_alive(fighter_ship, alive_ids):
                         fighter_ship.recalling = True
                         fighter_ship.selected = False  # stop being commanded by the player
                         # Play dock command sound
@@ -99,29 +215,17 @@ class HudUI:
 
         # Check ExpeditionShip preview click: select the mothership if clicked
         if not clicked_ui:
-            ms_center = self.expeditionship_preview['preview_position']
-            ms_w = self.expeditionship_preview['width']
-            ms_h = self.expeditionship_preview['height']
-            ms_rect = pygame.Rect(int(ms_center.x - ms_w / 2), int(ms_center.y - ms_h / 2), int(ms_w), int(ms_h))
-            if ms_rect.collidepoint(mouse_pos):
+            if self.expeditionship_preview['rect'].collidepoint(mouse_pos):
                 # select mothership and deselect others
                 for s in player_shapes:
                     s.selected = False
                 main_player.selected = True
                 clicked_ui = True
 
-        # Check Frigate preview click: select the first Frigate found in player_shapes
+        # Check Frigate preview click: select the expedition ship's escort frigate
         if not clicked_ui:
-            fr_center = self.frigate_preview['preview_position']
-            fr_w = self.frigate_preview['width'] * 2
-            fr_h = self.frigate_preview['height'] * 2
-            fr_rect = pygame.Rect(int(fr_center.x - fr_w / 2), int(fr_center.y - fr_h / 2), int(fr_w), int(fr_h))
-            if fr_rect.collidepoint(mouse_pos):
-                frigate = None
-                for s in player_shapes:
-                    if isinstance(s, Frigate):
-                        frigate = s
-                        break
+            if self.frigate_preview['rect'].collidepoint(mouse_pos):
+                frigate = getattr(main_player, 'frigate', None)
                 if frigate is not None and frigate.health > 0.0:
                     for s in player_shapes:
                         s.selected = False
@@ -130,33 +234,25 @@ class HudUI:
 
         # Check mini previews
         if not clicked_ui:
-            for i, hangar_slot in enumerate(self.hangar_slots):
-                preview_rect = pygame.Rect(
-                    hangar_slot['preview_position'].x - self.preview_size // 2,
-                    hangar_slot['preview_position'].y - self.preview_size // 2,
-                    self.preview_size, self.preview_size,
-                )
-                if preview_rect.collidepoint(mouse_pos):
-                    # If the craft is deployed and alive, select it; otherwise toggle the deploy/recall button
-                    icpts = getattr(hangar, 'ships', [None, None, None])
-                    fighter_ship = icpts[i] if i < len(icpts) else None
-                    fighter_alive = (
-                        fighter_ship is not None and
-                        fighter_ship in player_shapes and
-                        fighter_ship.health > 0.0
-                    )
-                    if fighter_alive:
-                        # Deselect all other ships and select this one
-                        for s in player_shapes:
-                            s.selected = False
-                        fighter_ship.selected = True
-                        # Also show the deploy/recall button for this deployed ship
-                        hangar_slot['show_button'] = True
-                    else:
-                        # Toggle deploy/recall button visibility above this preview
-                        hangar_slot['show_button'] = not hangar_slot['show_button']
-                    clicked_ui = True
-                    break
+            # one C-side scan over all slot rects instead of a Python loop
+            i = pygame.Rect(mouse_pos, (1, 1)).collidelist(self._slot_preview_rects)
+            if i != -1:
+                hangar_slot = self.hangar_slots[i]
+                # If the craft is deployed and alive, select it; otherwise toggle the deploy/recall button
+                icpts = getattr(hangar, 'ships', [None, None, None])
+                fighter_ship = icpts[i] if i < len(icpts) else None
+                fighter_alive = self._is_fighter_alive(fighter_ship, alive_ids)
+                if fighter_alive:
+                    # Deselect all other ships and select this one
+                    for s in player_shapes:
+                        s.selected = False
+                    fighter_ship.selected = True
+                    # Also show the deploy/recall button for this deployed ship
+                    hangar_slot['show_button'] = True
+                else:
+                    # Toggle deploy/recall button visibility above this preview
+                    hangar_slot['show_button'] = not hangar_slot['show_button']
+                clicked_ui = True
 
         return clicked_ui
 
@@ -164,26 +260,77 @@ class HudUI:
         for slot in self.hangar_slots:
             slot['show_button'] = False
 
+    @staticmethod
+    def _ship_state(ship):
+        """Return the health/armor values a preview bar is drawn from."""
+        return (
+            ship.health, ship.max_health,
+            getattr(ship, 'armor', 0), getattr(ship, 'max_armor', 0),
+        )
+
+    def _state_key(self, main_player, player_shapes, hangar, frigate):
+        """Return a tuple of everything `_render` depends on.
+
+        When it matches the previous frame the cached HUD strip is reused.
+        """
+        alive_ids = {id(s) for s in player_shapes}
+        ships = getattr(hangar, 'ships', [None, None, None])
+        slots = []
+        for i, hangar_slot in enumerate(self.hangar_slots):
+            fighter_ship = ships[i] if i < len(ships) else None
+            fighter_alive = self._is_fighter_alive(fighter_ship, alive_ids)
+            slots.append((
+                hangar.slots[i],
+                hangar.assignments[i] if i < len(hangar.assignments) else None,
+                self._ship_state(fighter_ship) if fighter_alive else None,
+                hangar_slot['show_button'],
+            ))
+        return (
+            self._ship_state(main_player),
+            self._ship_state(frigate) if frigate is not None and frigate.health > 0.0 else None,
+            tuple(slots),
+        )
+
     def draw(self, screen, main_player, player_shapes):
-        """Draw hangar previews, health bars, and active deploy/recall buttons."""
-        preview_size = self.preview_size
-        font = self.font
+        """Draw hangar previews, health bars, and active deploy/recall buttons.
+
+        The HUD strip is rendered into `_ui_surf` and only re-rendered when
+        the state it shows changes; otherwise the cached strip is blitted.
+        """
         # Require InventoryManager.hangar
         inv = getattr(main_player, 'inventory_manager', None)
         if inv is None or getattr(inv, 'hangar', None) is None:
             raise RuntimeError("Hangar/InventoryManager not available on main_player; migration required")
         hangar = inv.hangar
-        
+
+        frigate = getattr(main_player, 'frigate', None)
+
+        state = self._state_key(main_player, player_shapes, hangar, frigate)
+        if state != self._last_state:
+            self._ui_surf.fill((0, 0, 0, 0))
+            self._render(self._ui_surf, main_player, player_shapes, hangar, frigate)
+            # _render may hide buttons of empty slots; key on the post-render state
+            self._last_state = self._state_key(main_player, player_shapes, hangar, frigate)
+        screen.blit(self._ui_surf, self._ui_rect.topleft)
+
+    def _render(self, screen, main_player, player_shapes, hangar, frigate):
+        """Draw the HUD strip onto `screen` (the cached UI surface)."""
+        preview_size = self.preview_size
+        font = self.font
+        # Health/armor bars are collected here and blitted in one batch at the end
+        bars = []
+
         # --- Draw ExpeditionShip preview (sprite + hex overlay) ---
-        ms_center = self.expeditionship_preview['preview_position']
+        ms_center = self.expeditionship_preview['ui_position']
         ms_w = self.expeditionship_preview['width']
         ms_h = self.expeditionship_preview['height']
 
         # Hex overlay, scaled similarly to gameScreen (relative to ship size)
         hex_w = ms_w * 0.875   # 70/80 like in gameScreen
         hex_h = ms_h * 0.8     # 32/40
-        draw_hex(
+        self._blit_shape(
             screen,
+            draw_hex,
             (ms_center.x, ms_center.y),
             hex_w,
             hex_h,
@@ -191,7 +338,7 @@ class HudUI:
             3
         )
 
-        ms_surf = pygame.transform.smoothscale(preview_for_unit("expedition"), (ms_w, ms_h))
+        ms_surf = self._get_preview_surf("expedition", ms_w, ms_h)
         ms_x = int(ms_center.x - ms_w / 2)
         ms_y = int(ms_center.y - ms_h / 2)
         screen.blit(ms_surf, (ms_x, ms_y))
@@ -203,28 +350,19 @@ class HudUI:
         bar_x = ms_x
         bar_y = ms_y + ms_h + pad
 
-        draw_health_bar(screen, bar_x, bar_y, bar_w, bar_h, main_player.health, main_player.max_health)
-        # Armor bar directly under health, if the ship has armor
-        if getattr(main_player, 'max_armor', 0) > 0:
-            armor_y = bar_y + bar_h + 2
-            draw_armor_bar(screen, bar_x, armor_y, bar_w, bar_h, getattr(main_player, 'armor', 0), getattr(main_player, 'max_armor', 0))
+        self._queue_bars(bars, main_player, bar_x, bar_y, bar_w, bar_h)
 
         # ---------------------------------------------------------
         # --- Frigate preview (sprite + diamond overlay) ---
-        frigate = None
-        for s in player_shapes:
-            if isinstance(s, Frigate):
-                frigate = s
-                break
-
         if frigate is not None and frigate.health > 0.0:
-            fr_center = self.frigate_preview['preview_position']
+            fr_center = self.frigate_preview['ui_position']
             fr_w = self.frigate_preview['width'] * 2
             fr_h = self.frigate_preview['height'] * 2
 
             # Diamond overlay, scaled with same proportions as in gameScreen
-            draw_diamond(
+            self._blit_shape(
                 screen,
+                draw_diamond,
                 (fr_center.x, fr_center.y),
                 fr_w * 0.3,
                 fr_h * 0.75,
@@ -233,10 +371,7 @@ class HudUI:
             )
 
             # use frigate preview image
-            fr_img = pygame.transform.smoothscale(
-                preview_for_unit("frigate"),
-                (int(fr_w), int(fr_h))
-            )
+            fr_img = self._get_preview_surf("frigate", fr_w, fr_h)
             fr_x = int(fr_center.x - fr_w / 2)
             fr_y = int(fr_center.y - fr_h / 2)
             screen.blit(fr_img, (fr_x, fr_y))
@@ -248,15 +383,13 @@ class HudUI:
             bar_x = int(fr_x + (fr_w - bar_w) / 2)
             bar_y = fr_y + fr_h + pad
 
-            draw_health_bar(screen, bar_x, bar_y, bar_w, bar_h, frigate.health, frigate.max_health)
-            # Armor bar directly under health, if frigate has armor
-            if getattr(frigate, 'max_armor', 0) > 0:
-                armor_y = bar_y + bar_h + 2
-                draw_armor_bar(screen, bar_x, armor_y, bar_w, bar_h, getattr(frigate, 'armor', 0), getattr(frigate, 'max_armor', 0))
+            self._queue_bars(bars, frigate, bar_x, bar_y, bar_w, bar_h)
 
 
         # ---------------------------------------------------------
         # --- Draw hangar previews & deploy/recall buttons ---
+        # Build the deployed-ship lookup once instead of scanning per slot
+        alive_ids = {id(s) for s in player_shapes}
         for i, hangar_slot in enumerate(self.hangar_slots):
             # figure out which light craft (if any) is linked to this slot
             icpts = getattr(hangar, 'ships', [None, None, None])
@@ -264,11 +397,7 @@ class HudUI:
 
             # If this slot has neither a craft in hangar nor a live one deployed,
             # do not show a preview at all (this lets you have 0/1/2/3 previews).
-            fighter_alive = (
-                fighter_ship is not None and
-                fighter_ship in player_shapes and
-                fighter_ship.health > 0.0
-            )
+            fighter_alive = self._is_fighter_alive(fighter_ship, alive_ids)
             # Also check if there's an assignment in this slot (persisted after load)
             has_assignment = (i < len(hangar.assignments) and hangar.assignments[i] is not None)
             if not hangar.slots[i] and not fighter_alive and not has_assignment:
@@ -287,31 +416,26 @@ class HudUI:
                     if entry is not None:
                         unit_type = entry.unit_type
 
-            # Select the appropriate preview image based on unit type
-            if unit_type == "resource_collector":
-                craft_preview_img = self.resource_collector_preview_img.copy()
-            elif unit_type == "plasma_bomber":
-                craft_preview_img = self.bomber_preview_img.copy()
-            else:
+            # Select the appropriate preview image based on unit type;
+            # if it's still in hangar, use the darkened variant
+            if unit_type not in ("resource_collector", "plasma_bomber"):
                 # default to interceptor
-                craft_preview_img = self.interceptor_preview_img.copy()
-
-            # if it's still in hangar, darken the ship sprite itself (no dark box)
-            if hangar.slots[i]:
-                dim = pygame.Surface(craft_preview_img.get_size(), pygame.SRCALPHA)
-                dim.fill((128, 128, 128, 255))  # < 255 => darker
-                craft_preview_img.blit(dim, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+                unit_type = "interceptor"
+            craft_preview_img = self._get_preview_surf(
+                unit_type, preview_size, preview_size, dimmed=bool(hangar.slots[i])
+            )
 
             # Draw the appropriate shape overlay based on unit type
             craft_center = (
-                hangar_slot['preview_position'].x,
-                hangar_slot['preview_position'].y
+                hangar_slot['ui_position'].x,
+                hangar_slot['ui_position'].y
             )
             
             if unit_type == "resource_collector":
                 # Draw dalton shape for resource collector (long end pointing down)
-                draw_dalton(
+                self._blit_shape(
                     screen,
+                    draw_dalton,
                     craft_center,
                     preview_size * 1.2,
                     preview_size * 1.5,  # make it taller to emphasize the downward point
@@ -320,16 +444,18 @@ class HudUI:
                 )
             else:
                 # Draw triangle for interceptor
-                draw_triangle(
+                self._blit_shape(
                     screen,
+                    draw_triangle,
                     craft_center,
                     preview_size * 1.2,
+                    preview_size * 1.2,
                     (80, 255, 190),
                     2
                 )
             
-            preview_x = hangar_slot['preview_position'].x - preview_size // 2
-            preview_y = hangar_slot['preview_position'].y - preview_size // 2
+            preview_x = hangar_slot['ui_position'].x - preview_size // 2
+            preview_y = hangar_slot['ui_position'].y - preview_size // 2
             screen.blit(craft_preview_img, (preview_x, preview_y))
 
             # Health bar under preview when deployed and alive
@@ -340,22 +466,13 @@ class HudUI:
                 bar_x = preview_x
                 bar_y = preview_y + preview_size + pad
 
-                draw_health_bar(screen, bar_x, bar_y, bar_w, bar_h, fighter_ship.health, fighter_ship.max_health)
-                # Armor bar directly under health, if craft has armor
-                if getattr(fighter_ship, 'max_armor', 0) > 0:
-                    armor_y = bar_y + bar_h + 2
-                    draw_armor_bar(screen, bar_x, armor_y, bar_w, bar_h, getattr(fighter_ship, 'armor', 0), getattr(fighter_ship, 'max_armor', 0))
+                self._queue_bars(bars, fighter_ship, bar_x, bar_y, bar_w, bar_h)
                 # (Removed: mining meter above preview)
 
 
             # Draw deploy/recall button above preview if active
             if hangar_slot['show_button']:
-                btn_rect = pygame.Rect(
-                    hangar_slot['preview_position'].x - 40,
-                    hangar_slot['preview_position'].y - 65,
-                    80, 25,
-                )
-                hangar_slot['button_rect'] = btn_rect
+                btn_rect = hangar_slot['ui_button_rect']
 
                 if hangar.slots[i]:
                     # light craft still in hangar
@@ -369,4 +486,7 @@ class HudUI:
                 pygame.draw.rect(screen, btn_color, btn_rect, border_radius=6)
                 pygame.draw.rect(screen, (0, 0, 0), btn_rect, 2, border_radius=6)
                 text = font.render(label, True, UI_TAB_TEXT_SELECTED)
-                screen.blit(text, (btn_rect.x + 10, btn_rect.y + 3))
\ No newline at end of file
+                screen.blit(text, (btn_rect.x + 10, btn_rect.y + 3))
+
+        if bars:
+            screen.blits(bars, doreturn=False)
@@ -2,6 +2,7 @@
 
 This module exposes lightweight utilities used by the game's screens:
 - `Button`: simple rectangular button with hover rendering and click detection.
+- `CinematicBars`: letterbox bar state shared by the jump cinematic and map screens.
 - preview image loaders / scalers used across UI screens.
 - small polygon drawing helpers (triangle, diamond, dalton kite, hex).
 
@@ -10,7 +11,7 @@ to be safe for import from any UI module.
 """
 
 import pygame
-from spacegame.config import PREVIEWS_DIR
+from spacegame.config import PREVIEWS_DIR, SCREEN_HEIGHT
 
 
 class Button:
@@ -69,6 +70,25 @@ PREVIEW_IMAGE_MAP = {
 }
 
 
+class CinematicBars:
+    """Letterbox bars handed from the jump cinematic to the map screens.
+
+    `th` is the bar height; `top_y`/`bot_y` are the screen y of the top and
+    bottom bar, clamped here to the range between hidden (just off screen)
+    and fully closed so readers can fill them as-is; `close_speed` is the
+    slide speed in pixels per second.
+    """
+
+    __slots__ = ('th', 'top_y', 'bot_y', 'close_speed')
+
+    def __init__(self, th: int, top_y: int, bot_y: int, close_speed: float = 0.0):
+        th = int(th)
+        self.th = th
+        self.top_y = max(-th, min(int(top_y), 0))
+        self.bot_y = max(SCREEN_HEIGHT - th, min(int(bot_y), SCREEN_HEIGHT))
+        self.close_speed = close_speed
+
+
 def preview_for_unit(unit_type: str, default: str = "interceptor"):
     """Return the preview surface for the given `unit_type` string.
 